@@ -8,7 +8,8 @@ import subprocess
 import sys
 from pathlib import Path
 
-from src.adapters.spotify.auth import SPOTIFY_CACHE_PATH
+from src.adapters.spotify import SPOTIFY_CACHE_PATH
+from src.adapters.spotify.liked_songs_cache import LIKED_SONGS_CACHE_PATH
 
 DEFAULT_CLASSIFIER_CACHE = "classification_cache.json"
 LEGACY_SPOTIFY_CACHE_PATH = ".spotify_cache"
@@ -23,7 +24,7 @@ def _resolve(path_str: str) -> Path:
 
 def cache_paths(include_progress: bool = False) -> list[Path]:
     classifier_cache = os.getenv("TIDY_SPOTIFY_CACHE_FILE", DEFAULT_CLASSIFIER_CACHE)
-    candidates = [classifier_cache, SPOTIFY_CACHE_PATH, LEGACY_SPOTIFY_CACHE_PATH]
+    candidates = [classifier_cache, SPOTIFY_CACHE_PATH, LEGACY_SPOTIFY_CACHE_PATH, LIKED_SONGS_CACHE_PATH]
     if include_progress:
         candidates.append("progress.json")
 
@@ -1,5 +1,9 @@
 """LLM classifier adapters and provider registry."""
 
+from typing import Callable
+
+from src.domain.ports import ClassifierPort
+
 PROVIDERS = {
     "openai": {
         "name": "OpenAI",
@@ -16,3 +20,22 @@ PROVIDERS = {
 }
 
 DEFAULT_PROVIDER = "openai"
+
+
+# Provider SDKs are heavy; each factory imports its adapter on first use only.
+def _make_openai(**kwargs) -> ClassifierPort:
+    from src.adapters.classifier.openai_adapter import OpenAIClassifierAdapter
+
+    return OpenAIClassifierAdapter(**kwargs)
+
+
+def _make_anthropic(**kwargs) -> ClassifierPort:
+    from src.adapters.classifier.anthropic_adapter import AnthropicClassifierAdapter
+
+    return AnthropicClassifierAdapter(**kwargs)
+
+
+FACTORIES: dict[str, Callable[..., ClassifierPort]] = {
+    "openai": _make_openai,
+    "anthropic": _make_anthropic,
+}
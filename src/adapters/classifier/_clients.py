@@ -0,0 +1,19 @@
+"""Lifecycle helpers for the SDK clients held by LLM classifier adapters."""
+
+import asyncio
+import logging
+
+logger = logging.getLogger("tidy_ur_spotify.classifier")
+
+
+def close_async_client(client, loop: asyncio.AbstractEventLoop | None) -> None:
+    """Close an SDK async client from sync code, on the loop that owns its connections."""
+    if client is None:
+        return
+    try:
+        if loop is not None and loop.is_running():
+            asyncio.run_coroutine_threadsafe(client.close(), loop)
+        else:
+            asyncio.run(client.close())
+    except Exception:
+        logger.warning("Closing the async LLM client failed", exc_info=True)
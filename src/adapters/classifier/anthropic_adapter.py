@@ -1,5 +1,6 @@
 """Anthropic adapter for track classification."""
 
+import asyncio
 import logging
 import os
 import time
@@ -11,6 +12,7 @@ from src.adapters.classifier.persistent_cache import (
 )
 from src.domain.model import Suggestion, Track
 from src.domain.ports import ClassifierPort
+from src.adapters.classifier._clients import close_async_client
 from src.adapters.classifier._prompt import build_system_prompt, build_tracks_prompt, parse_suggestions
 
 logger = logging.getLogger("tidy_ur_spotify.classifier.anthropic")
@@ -28,11 +30,73 @@ class AnthropicClassifierAdapter(ClassifierPort):
             os.getenv("TIDY_SPOTIFY_CACHE_FILE", "classification_cache.json")
         )
         self._namespace = build_cache_namespace("anthropic", self.model, self.themes)
+        # Themes are fixed for the adapter's lifetime, so the system prompt is too.
+        self._system_prompt = build_system_prompt(self.themes)
+        # Reused across batches so HTTP keep-alive connections are shared.
+        self._async_client = None
+        self._async_loop: asyncio.AbstractEventLoop | None = None
 
     def classify_batch(self, tracks: list[Track]) -> list[Suggestion]:
         if not tracks:
             return []
 
+        uncached = self._collect_uncached(tracks)
+        if not uncached:
+            return self._get_cached(tracks)
+
+        timeout_s = _llm_timeout()
+        request = self._build_request(uncached)
+        started_at = self._log_request_started(len(uncached), timeout_s)
+
+        import anthropic
+        client = anthropic.Anthropic(api_key=self.api_key, timeout=timeout_s)
+        try:
+            response = client.messages.create(**request)
+        except Exception:
+            logger.exception("Anthropic request failed")
+            raise
+
+        self._store_response(uncached, self._parse_response(response), started_at)
+        return self._get_cached(tracks)
+
+    async def classify_batch_async(self, tracks: list[Track]) -> list[Suggestion]:
+        if not tracks:
+            return []
+
+        uncached = self._collect_uncached(tracks)
+        if not uncached:
+            return self._get_cached(tracks)
+
+        timeout_s = _llm_timeout()
+        request = self._build_request(uncached)
+        started_at = self._log_request_started(len(uncached), timeout_s)
+
+        if self._async_client is None:
+            import anthropic
+            self._async_client = anthropic.AsyncAnthropic(api_key=self.api_key, timeout=timeout_s)
+            self._async_loop = asyncio.get_running_loop()
+        try:
+            response = await self._async_client.messages.create(**request)
+        except Exception:
+            logger.exception("Anthropic request failed")
+            raise
+
+        # The persistent cache write hits the disk: keep it off the event loop.
+        await asyncio.to_thread(self._store_response, uncached, self._parse_response(response), started_at)
+        return self._get_cached(tracks)
+
+    def get_suggestions(self, track_id: str) -> list[Suggestion]:
+        return self._cache.get(track_id, [])
+
+    def preload(self, tracks: list[Track], batch_size: int = 10) -> None:
+        for i in range(0, len(tracks), batch_size):
+            self.classify_batch(tracks[i : i + batch_size])
+
+    def close(self) -> None:
+        client, self._async_client = self._async_client, None
+        close_async_client(client, self._async_loop)
+
+    def _collect_uncached(self, tracks: list[Track]) -> list[Track]:
         uncached: list[Track] = []
         cache_hits = 0
         for track in tracks:
@@ -49,36 +113,31 @@ class AnthropicClassifierAdapter(ClassifierPort):
 
         if cache_hits > 0:
             logger.info("Anthropic persistent cache hits=%s misses=%s", cache_hits, len(uncached))
-
-        if not uncached:
-            return self._get_cached(tracks)
-
-        system = build_system_prompt(self.themes)
-        user_msg = build_tracks_prompt(uncached)
-        timeout_s = float(os.getenv("TIDY_SPOTIFY_LLM_TIMEOUT", "90"))
-        started_at = time.perf_counter()
+        return uncached
+
+    def _build_request(self, uncached: list[Track]) -> dict:
+        """Keyword arguments for messages.create, shared by the blocking and async clients."""
+        return {
+            "model": self.model,
+            "max_tokens": 2048,
+            "system": self._system_prompt,
+            "messages": [{"role": "user", "content": build_tracks_prompt(uncached)}],
+        }
+
+    @staticmethod
+    def _parse_response(response) -> list[Suggestion]:
+        return parse_suggestions(response.content[0].text)
+
+    def _log_request_started(self, uncached_count: int, timeout_s: float) -> float:
         logger.info(
             "Anthropic request started (model=%s, uncached_tracks=%s, timeout=%.0fs)",
             self.model,
-            len(uncached),
+            uncached_count,
             timeout_s,
         )
+        return time.perf_counter()
 
-        import anthropic
-        client = anthropic.Anthropic(api_key=self.api_key, timeout=timeout_s)
-        try:
-            response = client.messages.create(
-                model=self.model,
-                max_tokens=2048,
-                system=system,
-                messages=[{"role": "user", "content": user_msg}],
-            )
-        except Exception:
-            logger.exception("Anthropic request failed")
-            raise
-        text = response.content[0].text
-
-        suggestions = parse_suggestions(text)
+    def _store_response(self, uncached: list[Track], suggestions: list[Suggestion], started_at: float) -> None:
         logger.info(
             "Anthropic request completed (duration=%.1fs, suggestions=%s)",
             time.perf_counter() - started_at,
@@ -102,15 +161,6 @@ class AnthropicClassifierAdapter(ClassifierPort):
                     to_persist[build_track_cache_key(self._namespace, track)] = track_suggestions
             self._persistent_cache.put_many(to_persist)
 
-        return self._get_cached(tracks)
-
-    def get_suggestions(self, track_id: str) -> list[Suggestion]:
-        return self._cache.get(track_id, [])
-
-    def preload(self, tracks: list[Track], batch_size: int = 10) -> None:
-        for i in range(0, len(tracks), batch_size):
-            self.classify_batch(tracks[i : i + batch_size])
-
     def _get_cached(self, tracks: list[Track]) -> list[Suggestion]:
         result = []
         for t in tracks:
@@ -118,5 +168,9 @@ class AnthropicClassifierAdapter(ClassifierPort):
         return result
 
 
+def _llm_timeout() -> float:
+    return float(os.getenv("TIDY_SPOTIFY_LLM_TIMEOUT", "90"))
+
+
 def _is_truthy(value: str) -> bool:
     return value.strip().lower() in {"1", "true", "yes", "on"}
@@ -0,0 +1,130 @@
+"""Classifier decorator that batches and de-duplicates concurrent requests."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from functools import partial
+
+from src.domain.model import Suggestion, Track
+from src.domain.ports import ClassifierPort
+
+logger = logging.getLogger("tidy_ur_spotify.classifier.batching")
+
+DEFAULT_BATCH_SIZE = 20
+DEFAULT_MAX_CONCURRENCY = 4
+
+
+class BatchingClassifierAdapter(ClassifierPort):
+    """Wrap a provider adapter so overlapping callers never pay for the same track twice.
+
+    Blocking calls are split into ``batch_size`` prompts sent on up to
+    ``max_concurrency`` threads. A track already being classified for another
+    caller is awaited instead of being sent again, on the blocking and async
+    paths alike. The async path sends its unclaimed tracks as one prompt:
+    pre-analysis already sizes its batches.
+    """
+
+    def __init__(
+        self,
+        inner: ClassifierPort,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ):
+        self.inner = inner
+        self.batch_size = max(1, batch_size)
+        self._executor = ThreadPoolExecutor(max_workers=max(1, max_concurrency), thread_name_prefix="classifier")
+        self._inflight: dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def classify_batch(self, tracks: list[Track]) -> list[Suggestion]:
+        return self._classify(tracks, self.batch_size)
+
+    def _classify(self, tracks: list[Track], batch_size: int) -> list[Suggestion]:
+        owned, waits = self._claim(tracks)
+        for start in range(0, len(owned), batch_size):
+            self._submit(owned[start : start + batch_size])
+        for future in waits:
+            future.result()
+        return [s for track in tracks for s in self.inner.get_suggestions(track.id)]
+
+    async def classify_batch_async(self, tracks: list[Track]) -> list[Suggestion]:
+        owned, waits = self._claim(tracks)
+        if owned:
+            error: BaseException | None = RuntimeError("Batch classification was interrupted")
+            try:
+                await self.inner.classify_batch_async(owned)
+                error = None
+            except Exception as exc:  # handed to every waiting caller
+                error = exc
+            finally:
+                self._resolve(owned, error)
+        for future in waits:
+            await asyncio.wrap_future(future)
+        return [s for track in tracks for s in self.inner.get_suggestions(track.id)]
+
+    def _claim(self, tracks: list[Track]) -> tuple[list[Track], list[Future]]:
+        """Register the tracks nobody is classifying yet; return them and a future per track."""
+        owned: list[Track] = []
+        waits: list[Future] = []
+        with self._lock:
+            for track in tracks:
+                future = self._inflight.get(track.id)
+                if future is None:
+                    future = Future()
+                    self._inflight[track.id] = future
+                    owned.append(track)
+                waits.append(future)
+        if len(owned) < len(tracks):
+            logger.debug("Joined %s in-flight tracks", len(tracks) - len(owned))
+        return owned, waits
+
+    def get_suggestions(self, track_id: str) -> list[Suggestion]:
+        return self.inner.get_suggestions(track_id)
+
+    def best_suggestion(self, track_id: str) -> Suggestion | None:
+        return self.inner.best_suggestion(track_id)
+
+    def preload(self, tracks: list[Track], batch_size: int = DEFAULT_BATCH_SIZE) -> None:
+        self._classify(tracks, max(1, batch_size))
+
+    def close(self) -> None:
+        """Stop the worker threads; queued batches are dropped and their waiters released."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.inner.close()
+
+    def _submit(self, batch: list[Track]) -> None:
+        try:
+            task = self._executor.submit(self._run_batch, batch)
+        except RuntimeError:  # closed
+            self._resolve(batch, RuntimeError("Classifier is closed"))
+            return
+        task.add_done_callback(partial(self._release_cancelled, batch))
+
+    def _release_cancelled(self, batch: list[Track], task: Future) -> None:
+        if task.cancelled():
+            self._resolve(batch, CancelledError())
+
+    def _run_batch(self, batch: list[Track]) -> None:
+        error: BaseException | None = RuntimeError("Batch classification was interrupted")
+        try:
+            self.inner.classify_batch(batch)
+            error = None
+        except Exception as exc:  # handed to every waiting caller
+            error = exc
+        finally:
+            # Whatever ends this batch, waiters must never hang on it.
+            self._resolve(batch, error)
+
+    def _resolve(self, batch: list[Track], error: BaseException | None) -> None:
+        with self._lock:
+            futures = [self._inflight.pop(track.id, None) for track in batch]
+        for future in futures:
+            if future is None:
+                continue
+            if error is None:
+                future.set_result(None)
+            else:
+                future.set_exception(error)
@@ -5,6 +5,8 @@ from __future__ import annotations
 import hashlib
 import json
 import logging
+import threading
+from collections.abc import Mapping
 from pathlib import Path
 
 from src.adapters.classifier._prompt import SYSTEM_PROMPT
@@ -17,14 +19,15 @@ def _sha1(value: str) -> str:
     return hashlib.sha1(value.encode("utf-8")).hexdigest()
 
 
-def build_cache_namespace(provider: str, model: str, themes: dict) -> str:
+def build_cache_namespace(provider: str, model: str, themes: Mapping) -> str:
     payload = {
         "provider": provider,
         "model": model,
         "themes": themes,
         "prompt_hash": _sha1(SYSTEM_PROMPT),
     }
-    serialized = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    # default=dict lets read-only theme mappings hash like the plain dicts they wrap.
+    serialized = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=dict)
     return _sha1(serialized)
 
 
@@ -49,6 +52,8 @@ class PersistentSuggestionCache:
     def __init__(self, path: str):
         self.path = Path(path)
         self._entries: dict[str, list[dict]] = {}
+        # Batches may complete on several threads at once; serialise writes and saves.
+        self._lock = threading.Lock()
         self._load()
 
     def get(self, key: str) -> list[Suggestion]:
@@ -66,6 +71,10 @@ class PersistentSuggestionCache:
         return suggestions
 
     def put_many(self, values: dict[str, list[Suggestion]]) -> None:
+        with self._lock:
+            self._put_many(values)
+
+    def _put_many(self, values: dict[str, list[Suggestion]]) -> None:
         changed = False
         for key, suggestions in values.items():
             if not suggestions:
@@ -0,0 +1,90 @@
+"""Progress decorator that coalesces rapid saves into one delayed write."""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import threading
+from dataclasses import replace
+from typing import Optional
+
+from src.domain.model import ClassificationSession, Decision
+from src.domain.ports import ProgressPort
+
+logger = logging.getLogger("tidy_ur_spotify.progress.debounced")
+
+PROGRESS_SAVE_DEBOUNCE_SECONDS = 0.5
+
+
+class DebouncedProgressAdapter(ProgressPort):
+    """Delay saves until the user pauses, so a burst of decisions costs one write.
+
+    The write happens on a timer thread. ``flush`` writes synchronously and is
+    also registered at interpreter exit until ``close``, so closing the window
+    loses nothing.
+    """
+
+    def __init__(self, inner: ProgressPort, delay: float = PROGRESS_SAVE_DEBOUNCE_SECONDS):
+        self.inner = inner
+        self.delay = delay
+        self._pending: ClassificationSession | None = None
+        self._timer: threading.Timer | None = None
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        atexit.register(self.flush)
+
+    def save(self, session: ClassificationSession) -> None:
+        with self._lock:
+            self._pending = session
+            if self._timer is not None:
+                return
+            self._timer = threading.Timer(self.delay, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self) -> None:
+        with self._write_lock:
+            with self._lock:
+                session, self._pending = self._pending, None
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+            if session is None:
+                return
+            # The UI keeps mutating the session and its decisions; write a copy of them.
+            snapshot = ClassificationSession(
+                current_index=session.current_index,
+                track_ids=session.track_ids,
+                decisions=[replace(d, themes=list(d.themes)) for d in list(session.decisions)],
+            )
+            try:
+                self.inner.save(snapshot)
+            except Exception:  # on the timer thread or at exit nobody else would see it
+                logger.exception("Unable to save classification progress")
+
+    def close(self) -> None:
+        """Write what is pending and drop the exit hook so this adapter can be collected."""
+        self.flush()
+        atexit.unregister(self.flush)
+
+    def load(self) -> Optional[ClassificationSession]:
+        self.flush()
+        return self.inner.load()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._pending = None
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        with self._write_lock:
+            self.inner.clear()
+
+    def exists(self) -> bool:
+        with self._lock:
+            if self._pending is not None:
+                return True
+        return self.inner.exists()
+
+    def export_csv(self, decisions: list[Decision], path: str) -> str:
+        return self.inner.export_csv(decisions, path)
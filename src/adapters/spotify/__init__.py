@@ -0,0 +1,7 @@
+"""Spotify adapters.
+
+Constants shared with non-Spotify modules live here so that reading them
+does not import spotipy.
+"""
+
+SPOTIFY_CACHE_PATH = "spotify_auth_cache.json"
@@ -1,22 +1,92 @@
 """Spotify OAuth2 authentication using spotipy."""
 
+import time
+
+import requests
 import spotipy
-from spotipy.oauth2 import SpotifyOAuth
+from requests.adapters import HTTPAdapter
+from spotipy.exceptions import SpotifyException
+from spotipy.oauth2 import SpotifyOAuth, SpotifyOauthError
+from urllib3.util.retry import Retry
+
+from src.adapters.spotify import SPOTIFY_CACHE_PATH
 
 SPOTIFY_SCOPE = "user-library-read playlist-modify-public playlist-modify-private playlist-read-private"
-SPOTIFY_CACHE_PATH = "spotify_auth_cache.json"
+TOKEN_MIN_TTL_SECONDS = 60
+# Large enough for concurrent liked-songs paging plus token refreshes.
+HTTP_POOL_SIZE = 16
+
+# (client_id, client_secret, redirect_uri) -> (client, current user, token expiry epoch)
+_client_cache: dict[tuple[str, str, str], tuple[spotipy.Spotify, dict, float]] = {}
+
+
+def build_http_session(pool_size: int = HTTP_POOL_SIZE) -> requests.Session:
+    """Return a keep-alive session with spotipy's default retry policy and a bigger pool."""
+    retry = Retry(
+        total=3,
+        connect=None,
+        read=False,
+        status=3,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(["GET", "POST", "PUT", "DELETE"]),
+        respect_retry_after_header=True,
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
 
 
 def get_spotify_client(
     client_id: str,
     client_secret: str,
     redirect_uri: str = "http://127.0.0.1:8888/callback",
+    requests_session: requests.Session | None = None,
 ) -> spotipy.Spotify:
+    # The OAuth manager and the API client share one connection pool.
+    session = requests_session or build_http_session()
     auth_manager = SpotifyOAuth(
         client_id=client_id,
         client_secret=client_secret,
         redirect_uri=redirect_uri,
         scope=SPOTIFY_SCOPE,
         cache_path=SPOTIFY_CACHE_PATH,
+        requests_session=session,
     )
-    return spotipy.Spotify(auth_manager=auth_manager)
+    return spotipy.Spotify(auth_manager=auth_manager, requests_session=session)
+
+
+def get_authenticated_client(
+    client_id: str,
+    client_secret: str,
+    redirect_uri: str = "http://127.0.0.1:8888/callback",
+) -> tuple[spotipy.Spotify, dict]:
+    """Return an authenticated client and its user, reused while the token stays valid."""
+    key = (client_id, client_secret, redirect_uri)
+    cached = _client_cache.get(key)
+    if cached and cached[2] - time.time() > TOKEN_MIN_TTL_SECONDS:
+        return cached[0], cached[1]
+
+    sp = get_spotify_client(client_id=client_id, client_secret=client_secret, redirect_uri=redirect_uri)
+    try:
+        user = sp.current_user()
+    except (SpotifyOauthError, SpotifyException) as error:
+        if isinstance(error, SpotifyException) and error.http_status != 401:
+            raise
+        # Stale or revoked token: drop the cached client and authenticate once more.
+        _client_cache.pop(key, None)
+        sp = get_spotify_client(client_id=client_id, client_secret=client_secret, redirect_uri=redirect_uri)
+        user = sp.current_user()
+
+    _client_cache[key] = (sp, user, _token_expires_at(sp))
+    return sp, user
+
+
+def _token_expires_at(sp: spotipy.Spotify) -> float:
+    try:
+        token_info = sp.auth_manager.cache_handler.get_cached_token() or {}
+    except Exception:
+        return 0.0
+    return float(token_info.get("expires_at", 0) or 0)
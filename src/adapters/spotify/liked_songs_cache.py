@@ -0,0 +1,47 @@
+"""Local JSON cache of the user's liked songs, so warm starts skip paging.
+
+The cache is never trusted on age alone: callers validate it against page 0
+of the live library (see ``SpotifyTrackAdapter.fetch_updates``).
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from dataclasses import asdict
+from pathlib import Path
+
+from src.domain.model import Track
+
+logger = logging.getLogger("tidy_ur_spotify.spotify.liked_cache")
+
+LIKED_SONGS_CACHE_PATH = "liked_songs_cache.json"
+
+
+class JsonLikedSongsCache:
+
+    def __init__(self, path: str = LIKED_SONGS_CACHE_PATH):
+        self.path = Path(path)
+
+    def load(self, user_id: str) -> list[Track] | None:
+        """Return cached tracks for user_id, or None when missing, foreign or unreadable."""
+        if not self.path.exists():
+            return None
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            if data.get("user_id") != user_id:
+                return None
+            return [Track(**item) for item in data.get("tracks", [])]
+        except (OSError, ValueError, TypeError, AttributeError):
+            logger.warning("Ignoring unreadable liked songs cache: %s", self.path)
+            return None
+
+    def save(self, user_id: str, tracks: list[Track]) -> None:
+        data = {"user_id": user_id, "tracks": [asdict(track) for track in tracks]}
+        temp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        try:
+            temp_path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+            os.replace(temp_path, self.path)
+        except OSError:
+            logger.warning("Unable to write liked songs cache: %s", self.path)
@@ -1,50 +1,113 @@
 """Spotify adapter for fetching liked songs."""
 
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator
+
 import spotipy
+from spotipy.exceptions import SpotifyException
 
 from src.domain.model import Track
 from src.domain.ports import TrackSourcePort
 
+logger = logging.getLogger("tidy_ur_spotify.spotify.tracks")
+
+PAGE_SIZE = 50
+DEFAULT_FETCH_CONCURRENCY = 4
+RATE_LIMIT_RETRIES = 3
+
 
 class SpotifyTrackAdapter(TrackSourcePort):
 
-    def __init__(self, sp: spotipy.Spotify):
+    def __init__(self, sp: spotipy.Spotify, concurrency: int = DEFAULT_FETCH_CONCURRENCY):
         self.sp = sp
+        self.concurrency = max(1, int(concurrency))
+
+    def fetch_all(self, on_progress: Callable[[int, int], None] | None = None) -> list[Track]:
+        """Fetch every liked song; on_progress receives (loaded, total) after each page."""
+        return self._fetch_from(self._fetch_page(0), on_progress)
+
+    def iter_pages(self, first: dict | None = None) -> Iterator[list[Track]]:
+        """Yield liked songs page by page in library order; later pages are fetched concurrently."""
+        if first is None:
+            first = self._fetch_page(0)
+        yield self._parse_items(first.get("items", []))
+        offsets = range(PAGE_SIZE, first.get("total", 0), PAGE_SIZE)
+        if not offsets:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(self.concurrency, len(offsets))) as executor:
+            # map() yields in submission order, which keeps Spotify's "most recently liked first" order.
+            for results in executor.map(self._fetch_page, offsets):
+                yield self._parse_items(results.get("items", []))
 
-    def fetch_all(self) -> list[Track]:
+    def fetch_updates(
+        self,
+        known: list[Track],
+        on_progress: Callable[[int, int], None] | None = None,
+    ) -> list[Track]:
+        """Refresh a previously fetched library with a single page request when possible.
+
+        Liked songs are ordered newest first, so new likes show up at the head of
+        page 0. If the rest of page 0 and the total line up with ``known``, the
+        cached tail is reused; any other change falls back to a full fetch.
+        """
+        first = self._fetch_page(0)
+        head = self._parse_items(first.get("items", []))
+        head_ids = [track.id for track in head]
+        if known and known[0].id in head_ids:
+            added = head_ids.index(known[0].id)
+            overlap = head_ids[added:]
+            if (
+                first.get("total", 0) == len(known) + added
+                and overlap == [track.id for track in known[: len(overlap)]]
+            ):
+                return head + known[len(overlap):]
+        return self._fetch_from(first, on_progress)
+
+    def _fetch_from(self, first: dict, on_progress: Callable[[int, int], None] | None = None) -> list[Track]:
+        total = first.get("total", 0)
         tracks: list[Track] = []
-        offset = 0
-        limit = 50
-
-        while True:
-            results = self.sp.current_user_saved_tracks(limit=limit, offset=offset)
-            items = results.get("items", [])
-            if not items:
-                break
-
-            for item in items:
-                t = item["track"]
-                album = t.get("album", {})
-                images = album.get("images", [])
-                cover_url = images[0].get("url") if images and isinstance(images[0], dict) else None
-                artists = ", ".join(a["name"] for a in t.get("artists", []))
-                track = Track(
-                    id=t["id"],
-                    name=t["name"],
-                    artist=artists,
-                    album=album.get("name", ""),
-                    release_date=album.get("release_date", ""),
-                    explicit=bool(t.get("explicit", False)),
-                    album_image_url=cover_url,
-                    preview_url=t.get("preview_url"),
-                    genres=[],
-                    popularity=t.get("popularity"),
-                    duration_ms=t.get("duration_ms", 0),
-                )
-                tracks.append(track)
-
-            offset += limit
-            if offset >= results.get("total", 0):
-                break
+        for page in self.iter_pages(first):
+            tracks.extend(page)
+            if on_progress:
+                on_progress(len(tracks), total)
+        return tracks
 
+    def _fetch_page(self, offset: int) -> dict:
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            try:
+                return self.sp.current_user_saved_tracks(limit=PAGE_SIZE, offset=offset)
+            except SpotifyException as error:
+                if error.http_status != 429 or attempt == RATE_LIMIT_RETRIES:
+                    raise
+                retry_after = float((error.headers or {}).get("Retry-After", 1) or 1)
+                logger.info("Rate limited on offset=%s, retrying in %ss", offset, retry_after)
+                time.sleep(retry_after)
+        return {}
+
+    @staticmethod
+    def _parse_items(items: list[dict]) -> list[Track]:
+        tracks: list[Track] = []
+        for item in items:
+            t = item["track"]
+            album = t.get("album", {})
+            images = album.get("images", [])
+            cover_url = images[0].get("url") if images and isinstance(images[0], dict) else None
+            artists = ", ".join(a["name"] for a in t.get("artists", []))
+            track = Track(
+                id=t["id"],
+                name=t["name"],
+                artist=artists,
+                album=album.get("name", ""),
+                release_date=album.get("release_date", ""),
+                explicit=bool(t.get("explicit", False)),
+                album_image_url=cover_url,
+                preview_url=t.get("preview_url"),
+                genres=[],
+                popularity=t.get("popularity"),
+                duration_ms=t.get("duration_ms", 0),
+            )
+            tracks.append(track)
         return tracks
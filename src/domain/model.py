@@ -4,7 +4,7 @@ from dataclasses import dataclass, field
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Track:
     id: str
     name: str
@@ -19,7 +19,7 @@ class Track:
     genres: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Theme:
     key: str
     name: str
@@ -27,7 +27,7 @@ class Theme:
     shortcut: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Suggestion:
     track_id: str
     theme_key: str
@@ -35,7 +35,7 @@ class Suggestion:
     reasoning: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Decision:
     track_id: str
     track_name: str
@@ -44,29 +44,40 @@ class Decision:
     skipped: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ClassificationSession:
+    """Progress through the Liked Songs.
+
+    ``decisions`` is owned by the session: change it through ``add_decision``
+    and ``undo_last`` so the track-id index stays in step.
+    """
+
     current_index: int = 0
     track_ids: list[str] = field(default_factory=list)
     decisions: list[Decision] = field(default_factory=list)
+    _by_track_id: dict[str, Decision] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        for d in self.decisions:
+            self._by_track_id.setdefault(d.track_id, d)
 
     @property
     def decided_count(self) -> int:
         return len(self.decisions)
 
     def decision_for(self, track_id: str) -> Optional[Decision]:
-        for d in self.decisions:
-            if d.track_id == track_id:
-                return d
-        return None
+        return self._by_track_id.get(track_id)
 
     def add_decision(self, decision: Decision) -> None:
         self.decisions.append(decision)
         self.current_index += 1
+        self._by_track_id.setdefault(decision.track_id, decision)
 
     def undo_last(self) -> Optional[Decision]:
         if not self.decisions or self.current_index <= 0:
             return None
         last = self.decisions.pop()
         self.current_index -= 1
+        if self._by_track_id.get(last.track_id) is last:
+            del self._by_track_id[last.track_id]
         return last
@@ -1,5 +1,6 @@
 """Ports (interfaces) for the hexagonal architecture."""
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Optional
 
@@ -23,14 +24,33 @@ class ClassifierPort(ABC):
     def classify_batch(self, tracks: list[Track]) -> list[Suggestion]:
         ...
 
+    async def classify_batch_async(self, tracks: list[Track]) -> list[Suggestion]:
+        """Classify without blocking the event loop.
+
+        Adapters backed by an async-capable SDK override this; the default
+        offloads the blocking call to a worker thread.
+        """
+        return await asyncio.to_thread(self.classify_batch, tracks)
+
     @abstractmethod
     def get_suggestions(self, track_id: str) -> list[Suggestion]:
         ...
 
+    def best_suggestion(self, track_id: str) -> Optional[Suggestion]:
+        """Highest-confidence suggestion for track_id (first one wins ties), or None."""
+        best = None
+        for suggestion in self.get_suggestions(track_id):
+            if best is None or suggestion.confidence > best.confidence:
+                best = suggestion
+        return best
+
     @abstractmethod
     def preload(self, tracks: list[Track], batch_size: int) -> None:
         ...
 
+    def close(self) -> None:
+        """Release clients and threads. Adapters holding none have nothing to do."""
+
 
 class PlaylistPort(ABC):
     @abstractmethod
@@ -63,6 +83,9 @@ class ProgressPort(ABC):
     def export_csv(self, decisions: list[Decision], path: str) -> str:
         ...
 
+    def flush(self) -> None:
+        """Write any buffered save now. Adapters that save immediately have nothing to do."""
+
 
 class ConfigPort(ABC):
     @abstractmethod
@@ -2,36 +2,48 @@
 
 import atexit
 import asyncio
+import functools
+import hashlib
 import json
 import logging
 import os
 import platform
+import re
 import signal
 import socket
+import subprocess
 import sys
 import threading
 import time
 import traceback
 import webbrowser
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
+from typing import Callable, Hashable, TypeVar
 from urllib.parse import urlparse
 
 import flet as ft
 
-from src.adapters.classifier import DEFAULT_PROVIDER, PROVIDERS
+from src.adapters.classifier import DEFAULT_PROVIDER, FACTORIES, PROVIDERS
+from src.adapters.classifier.batching import DEFAULT_MAX_CONCURRENCY, BatchingClassifierAdapter
 from src.adapters.cache.local_cache import clear_cache
 from src.adapters.config.json_config_adapter import JsonConfigAdapter
+from src.adapters.progress.debounced_progress_adapter import DebouncedProgressAdapter
 from src.adapters.progress.json_progress_adapter import JsonProgressAdapter
-from src.adapters.spotify.auth import get_spotify_client
 from src.adapters.spotify.dry_run_playlist_adapter import DryRunPlaylistAdapter
-from src.adapters.spotify.playlist_adapter import SpotifyPlaylistAdapter
-from src.adapters.spotify.track_adapter import SpotifyTrackAdapter
+from src.adapters.spotify.liked_songs_cache import JsonLikedSongsCache
 from src.domain.model import Theme
-from src.ui.branding import app_icon_src, build_logo
+from src.ui.branding import app_icon_src, build_logo, resize_logo
+from src.ui.classify_view import ClassifyView
+from src.ui.debounce import Debouncer
 from src.ui.legal import LEGAL_ACK_LABEL, LEGAL_DISCLAIMER_FULL
+from src.ui.setup_view import SetupView
 from src.ui.theme import ACCENT, BG, BG_CARD, BG_INPUT, BORDER, DANGER, FG, FG_DIM
 from src.ui.workflow_header import build_workflow_header
+from src.usecases.check_update import CheckUpdateUseCase
 from src.version import __version__
 
 THEMES = {
@@ -55,9 +67,33 @@ THEMES = {
     ),
 }
 
-THEMES_DICT = {k: {"name": v.name, "description": v.description, "key": v.shortcut} for k, v in THEMES.items()}
+# Shared read-only with every adapter, so none of them can alter the others' view.
+THEMES_DICT = MappingProxyType(
+    {
+        k: MappingProxyType({"name": v.name, "description": v.description, "key": v.shortcut})
+        for k, v in THEMES.items()
+    }
+)
+
+_REDIRECT_MISMATCH_HINT = (
+    "The redirect URI in your Spotify app settings doesn't match.\nExpected: http://127.0.0.1:8888/callback"
+)
+# (needle, case-sensitive, hint) — first match wins. Spotify reports redirect
+# mismatches as upper-case INVALID_CLIENT and bad credentials as invalid_client.
+ERROR_HINTS = (
+    ("INVALID_CLIENT", True, _REDIRECT_MISMATCH_HINT),
+    ("Invalid redirect URI", True, _REDIRECT_MISMATCH_HINT),
+    ("invalid_client", False, "Your Client ID or Client Secret is incorrect."),
+    ("Address already in use", True, "Port 8888 is already in use. Close other instances and retry."),
+)
+DEFAULT_ERROR_HINT = "Check your Spotify Developer credentials and try again."
+SECRET_KEY_RE = re.compile(r"secret|key|token|password", re.IGNORECASE)
 
 LOCK_FILE = Path.home() / ".tidy-ur-spotify.lock"
+LOCK_ACQUIRE_TIMEOUT_SECONDS = 3.0
+PROCESS_QUERY_TIMEOUT_SECONDS = 5.0
+# Windows byte locks are mandatory: lock a byte past the PID so other processes can still read it.
+WINDOWS_LOCK_OFFSET = 1 << 20
 SIMULATION_ENV_VAR = "TIDY_SPOTIFY_SIMULATION"
 DISCLAIMER_LOGO_SIZE = 176
 READY_LOGO_SIZE = 280
@@ -72,37 +108,99 @@ RUNNER_UPCOMING_LABEL_COUNT = 8
 RUNNER_CURRENT_LABEL_COUNT = 10
 RUNNER_EVENT_MAX = 120
 PAUSE_COLOR = "#F59E0B"
+UI_FRAME_INTERVAL = 1 / 30
+PORT_PROBE_TTL_SECONDS = 1.0
 
 logger = logging.getLogger("tidy_ur_spotify.ui")
 
+T = TypeVar("T")
+
+_inflight: dict[Hashable, Future] = {}
+_inflight_lock = threading.Lock()
+
+_port_probe_cache: dict[int, tuple[float, bool]] = {}
+_lock_fd: int | None = None  # kept open so the OS lock lives as long as the process
+
 
 def _is_truthy(value: str) -> bool:
     return value.strip().lower() in {"1", "true", "yes", "on"}
 
 
+def _read_lock() -> tuple[int | None, str]:
+    """Read (PID, instance token) from the lock file; (None, "") if missing or invalid."""
+    try:
+        pid, _, token = LOCK_FILE.read_text().partition("\n")
+        return int(pid.strip()), token.strip()
+    except (ValueError, OSError):
+        return None, ""
+
+
 def _get_lock_pid() -> int | None:
     """Read PID from lock file, return None if not found or invalid."""
+    return _read_lock()[0]
+
+
+def _instance_token(pid: int) -> str:
+    """Fingerprint a process by its full command line ("" if it cannot be read)."""
+    cmdline = _process_cmdline(pid)
+    return hashlib.sha256(cmdline.encode()).hexdigest() if cmdline else ""
+
+
+def _process_cmdline(pid: int) -> str | None:
+    """Return the command line of a process, or None if it is not running."""
+    if Path("/proc").is_dir():
+        try:
+            raw = Path(f"/proc/{pid}/cmdline").read_bytes()
+        except OSError:
+            return None
+        return raw.replace(b"\0", b" ").decode("utf-8", errors="replace").strip()
+
+    if sys.platform.startswith("win"):
+        # tasklist only reports the image name (python.exe); CIM has the full command line.
+        query = f"(Get-CimInstance Win32_Process -Filter 'ProcessId={int(pid)}').CommandLine"
+        command = ["powershell", "-NoProfile", "-NonInteractive", "-Command", query]
+    else:
+        command = ["ps", "-p", str(pid), "-o", "command="]
     try:
-        if LOCK_FILE.exists():
-            return int(LOCK_FILE.read_text().strip())
-    except (ValueError, OSError):
+        output = subprocess.run(
+            command, capture_output=True, text=True, timeout=PROCESS_QUERY_TIMEOUT_SECONDS
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return output or None
+
+
+def _boot_time() -> float | None:
+    """Return system boot time (epoch seconds) where cheaply available."""
+    try:
+        for line in Path("/proc/stat").read_text().splitlines():
+            if line.startswith("btime "):
+                return float(line.split()[1])
+    except (OSError, ValueError, IndexError):
         pass
     return None
 
 
-def _is_process_running(pid: int) -> bool:
-    """Check if a process with given PID is running."""
-    try:
-        os.kill(pid, 0)
-        return True
-    except (OSError, ProcessLookupError):
+def _is_process_running(pid: int, token: str) -> bool:
+    """Check if PID is the instance that wrote token (PIDs get reused after a stale lock)."""
+    if pid == os.getpid() or not token:
         return False
+    return _instance_token(pid) == token
 
 
 def _kill_previous_instance() -> bool:
     """Kill previous instance if running. Returns True if killed."""
-    pid = _get_lock_pid()
-    if pid and _is_process_running(pid):
+    boot_time = _boot_time()
+    try:
+        if boot_time is not None and LOCK_FILE.stat().st_mtime < boot_time:
+            # Lock written before the last reboot: its PID cannot be ours anymore.
+            LOCK_FILE.unlink(missing_ok=True)
+            return False
+    except OSError:
+        pass
+
+    pid, token = _read_lock()
+    if pid and _is_process_running(pid, token):
         try:
             os.kill(pid, signal.SIGTERM)
             return True
@@ -111,30 +209,105 @@ def _kill_previous_instance() -> bool:
     return False
 
 
-def _create_lock():
-    """Create lock file with current PID."""
-    LOCK_FILE.write_text(str(os.getpid()))
+def _try_lock(fd: int) -> bool:
+    """Take a non-blocking exclusive OS lock on fd."""
+    try:
+        if sys.platform.startswith("win"):
+            import msvcrt
+
+            os.lseek(fd, WINDOWS_LOCK_OFFSET, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        return False
+    return True
+
+
+def _create_lock() -> bool:
+    """Hold the lock file for the process lifetime. Returns False if another instance owns it."""
+    global _lock_fd
+    fd = os.open(LOCK_FILE, os.O_CREAT | os.O_RDWR, 0o644)
+    # A previous instance we just signalled may need a moment to release its lock.
+    deadline = time.monotonic() + LOCK_ACQUIRE_TIMEOUT_SECONDS
+    while not _try_lock(fd):
+        if time.monotonic() >= deadline:
+            os.close(fd)
+            return False
+        time.sleep(0.1)
+
+    os.ftruncate(fd, 0)
+    os.lseek(fd, 0, os.SEEK_SET)
+    os.write(fd, f"{os.getpid()}\n{_instance_token(os.getpid())}".encode())
+    os.fsync(fd)
+    _lock_fd = fd
     atexit.register(_remove_lock)
+    return True
 
 
 def _remove_lock():
-    """Remove lock file on exit."""
+    """Release the lock on exit (the file stays so no one can lock a stale inode)."""
+    global _lock_fd
+    if _lock_fd is None:
+        return
     try:
-        LOCK_FILE.unlink(missing_ok=True)
+        os.ftruncate(_lock_fd, 0)
+        os.close(_lock_fd)
     except OSError:
         pass
+    _lock_fd = None
+
+
+def _once(key: Hashable, fn: Callable[[], T]) -> T:
+    """Run fn for key unless a call is already in flight; concurrent callers share its result."""
+    with _inflight_lock:
+        future = _inflight.get(key)
+        owner = future is None
+        if owner:
+            future = Future()
+            _inflight[key] = future
+
+    if not owner:
+        return future.result()
+
+    try:
+        result = fn()
+    except BaseException as error:  # also KeyboardInterrupt/SystemExit: waiters must not hang
+        future.set_exception(error)
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        with _inflight_lock:
+            _inflight.pop(key, None)
 
 
 def _is_port_available(port: int) -> bool:
     """Check if a port is available for binding."""
+    cached = _port_probe_cache.get(port)
+    now = time.monotonic()
+    if cached and now - cached[0] < PORT_PROBE_TTL_SECONDS:
+        return cached[1]
+
     with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        # Ignore our own TIME_WAIT leftovers after a fast restart. On Windows this
+        # flag would allow stealing a bound port, so keep the default there.
+        if not sys.platform.startswith("win"):
+            s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         try:
             s.bind(("127.0.0.1", port))
-            return True
+            available = True
         except OSError:
-            return False
+            available = False
 
+    _port_probe_cache[port] = (now, available)
+    return available
 
+
+@functools.lru_cache(maxsize=8)
 def _get_port_from_uri(uri: str) -> int:
     """Extract port number from redirect URI."""
     parsed = urlparse(uri)
@@ -144,12 +317,10 @@ def _get_port_from_uri(uri: str) -> int:
 def _generate_bug_report(error: Exception, config: dict, context: str = "") -> str:
     """Generate a bug report with debug context."""
     # Mask sensitive data
-    safe_config = {}
-    for key, value in config.items():
-        if any(secret in key.lower() for secret in ["secret", "key", "token", "password"]):
-            safe_config[key] = "***MASKED***" if value else "(empty)"
-        else:
-            safe_config[key] = value
+    safe_config = {
+        key: ("***MASKED***" if value else "(empty)") if SECRET_KEY_RE.search(key) else value
+        for key, value in config.items()
+    }
 
     report = {
         "timestamp": datetime.now().isoformat(),
@@ -170,10 +341,41 @@ def _generate_bug_report(error: Exception, config: dict, context: str = "") -> s
     return json.dumps(report, indent=2, default=str)
 
 
+def _show_already_running(page: ft.Page, pid: int | None) -> None:
+    """Explain why this launch stops instead of exiting without a window."""
+    page.title = "Tidy ur Spotify"
+    page.bgcolor = BG
+    page.window.width = 560
+    page.window.height = 260
+    owner = f" (pid {pid})" if pid else ""
+    page.add(
+        ft.Container(
+            content=ft.Column(
+                [
+                    ft.Text("Tidy ur Spotify is already running", size=18, weight=ft.FontWeight.BOLD, color=FG),
+                    ft.Text(
+                        f"Another instance{owner} is still open. Close it, then start the app again.",
+                        size=13,
+                        color=FG_DIM,
+                    ),
+                    ft.ElevatedButton("Close", on_click=lambda _: page.window.close(), bgcolor=ACCENT, color=BG),
+                ],
+                spacing=14,
+            ),
+            padding=24,
+        )
+    )
+    page.update()
+
+
 def run_app():
     # Single instance: kill previous instance if running
     _kill_previous_instance()
-    _create_lock()
+    if not _create_lock():
+        pid = _get_lock_pid()
+        logger.warning("Another instance (pid %s) holds %s; exiting", pid, LOCK_FILE)
+        ft.app(target=functools.partial(_show_already_running, pid=pid))
+        sys.exit(1)
     logger.info("App boot sequence started")
 
     def main(page: ft.Page):
@@ -225,14 +427,11 @@ def run_app():
 
             # Determine user-friendly error message
             error_str = str(error)
-            if "INVALID_CLIENT" in error_str or "Invalid redirect URI" in error_str:
-                hint = "The redirect URI in your Spotify app settings doesn't match.\nExpected: http://127.0.0.1:8888/callback"
-            elif "invalid_client" in error_str.lower():
-                hint = "Your Client ID or Client Secret is incorrect."
-            elif "Address already in use" in error_str:
-                hint = "Port 8888 is already in use. Close other instances and retry."
-            else:
-                hint = "Check your Spotify Developer credentials and try again."
+            error_low = error_str.lower()
+            hint = next(
+                (hint for needle, exact, hint in ERROR_HINTS if needle in (error_str if exact else error_low)),
+                DEFAULT_ERROR_HINT,
+            )
 
             page.controls.clear()
             page.add(
@@ -285,13 +484,24 @@ def run_app():
             )
             page.update()
 
+        # "closers" release what the current classification session holds (pools, pending saves).
+        launch_state = {"generation": 0, "closers": []}
+
+        def end_session():
+            closers, launch_state["closers"] = launch_state["closers"], []
+            for close in closers:
+                try:
+                    close()
+                except Exception:
+                    logger.exception("Closing the previous session failed")
+
         def start_setup_wizard(start_step: int = 0):
             """Show setup wizard to reconfigure, optionally starting at a specific step."""
             logger.info("Opening setup wizard (step=%s)", start_step)
+            end_session()
             page.on_keyboard_event = None
             page.on_resized = None
             page.controls.clear()
-            from src.ui.setup_view import SetupView
             setup = SetupView(
                 page=page,
                 config=config,
@@ -300,10 +510,12 @@ def run_app():
                 on_cancel=lambda: launch_classification() if config.is_configured() else show_legal_gate(),
             )
             setup.expand = True
+            launch_state["closers"].append(setup.close)
             page.add(setup)
             page.update()
 
         def show_legal_gate():
+            end_session()
             cfg = config.load()
             logger.info("Showing legal gate (acknowledged=%s)", bool(cfg.get("legal_acknowledged", False)))
 
@@ -386,7 +598,11 @@ def run_app():
             page.update()
 
         def launch_classification():
+            """Show the status screen, then authenticate and fetch on a worker thread."""
             logger.info("Launching classification home")
+            end_session()
+            launch_state["generation"] += 1
+            generation = launch_state["generation"]
             page.on_keyboard_event = None
             page.on_resized = None
 
@@ -405,6 +621,20 @@ def run_app():
                 dialog.open = True
                 page.update()
 
+            # One status screen for auth and fetch; later stages only change the texts.
+            status_text = ft.Text("Authenticating with Spotify...", color=FG, size=14)
+            sub_text = ft.Text("", color=FG_DIM, size=12, visible=False)
+
+            def is_current() -> bool:
+                # A newer launch or a cancel makes this worker's results obsolete.
+                return launch_state["generation"] == generation
+
+            def on_cancel_loading(_):
+                logger.info("Spotify loading cancelled by user")
+                launch_state["generation"] += 1
+                start_setup_wizard(0)
+
+            cancel_loading_button = ft.TextButton("Cancel", on_click=on_cancel_loading)
             page.controls.clear()
             page.add(
                 ft.Container(
@@ -412,7 +642,9 @@ def run_app():
                         [
                             build_logo(84),
                             ft.ProgressRing(color=ACCENT),
-                            ft.Text("Authenticating with Spotify...", color=FG, size=14),
+                            status_text,
+                            sub_text,
+                            cancel_loading_button,
                         ],
                         horizontal_alignment=ft.CrossAxisAlignment.CENTER,
                         alignment=ft.MainAxisAlignment.CENTER,
@@ -424,12 +656,14 @@ def run_app():
             )
             page.update()
 
-            cfg = config.load()
-            simulation_mode = bool(cfg.get("simulation_mode", False)) or _is_truthy(os.getenv(SIMULATION_ENV_VAR, ""))
-            redirect_uri = cfg.get("spotify_redirect_uri", "http://127.0.0.1:8888/callback")
-            port = _get_port_from_uri(redirect_uri)
+            def show_status(detail: str, status: str | None = None):
+                if status is not None:
+                    status_text.value = status
+                sub_text.value = detail
+                sub_text.visible = True
+                page.update()
 
-            if not _is_port_available(port):
+            def show_port_unavailable(port: int):
                 page.controls.clear()
                 page.add(
                     ft.Container(
@@ -456,44 +690,103 @@ def run_app():
                     )
                 )
                 page.update()
-                return
 
-            try:
-                sp = get_spotify_client(
-                    client_id=cfg["spotify_client_id"],
-                    client_secret=cfg["spotify_client_secret"],
-                    redirect_uri=redirect_uri,
+            async def _run_if_current(fn: Callable[..., None], *args):
+                if is_current():
+                    fn(*args)
+
+            def on_ui(fn: Callable[..., None], *args):
+                # The worker only does the blocking I/O; controls are touched on the page's event loop.
+                page.run_task(_run_if_current, fn, *args)
+
+            def _prepare_launcher():
+                # spotipy is only needed once the status screen is up; importing it here keeps it off first paint.
+                from src.adapters.spotify.auth import get_authenticated_client
+                from src.adapters.spotify.track_adapter import DEFAULT_FETCH_CONCURRENCY, SpotifyTrackAdapter
+
+                cfg = config.load()
+                redirect_uri = cfg.get("spotify_redirect_uri", "http://127.0.0.1:8888/callback")
+                port = _get_port_from_uri(redirect_uri)
+
+                if not _is_port_available(port):
+                    on_ui(show_port_unavailable, port)
+                    return
+
+                try:
+                    # Keyed on the credentials: a relaunch with other ones must not join a stale OAuth flow.
+                    sp, user = _once(
+                        ("spotify-auth", cfg["spotify_client_id"], cfg["spotify_client_secret"], redirect_uri),
+                        lambda: get_authenticated_client(
+                            client_id=cfg["spotify_client_id"],
+                            client_secret=cfg["spotify_client_secret"],
+                            redirect_uri=redirect_uri,
+                        ),
+                    )
+                    logger.info("Spotify auth success (user=%s)", user.get("display_name") or user.get("id"))
+                except Exception as e:
+                    logger.exception("Spotify authentication failed")
+                    on_ui(show_error_view, e, "Spotify authentication", cfg, 0)
+                    return
+                if not is_current():
+                    return
+
+                on_ui(show_status, "Fetching liked songs...", f"Logged in as {user['display_name']}")
+
+                liked_cache = JsonLikedSongsCache()
+                known_tracks = liked_cache.load(user["id"])
+                track_source = SpotifyTrackAdapter(
+                    sp, concurrency=cfg.get("spotify_fetch_concurrency", DEFAULT_FETCH_CONCURRENCY)
                 )
-                user = sp.current_user()
-                logger.info("Spotify auth success (user=%s)", user.get("display_name") or user.get("id"))
-            except Exception as e:
-                logger.exception("Spotify authentication failed")
-                show_error_view(e, "Spotify authentication", cfg, start_step=0)
-                return
+                fetch_progress = {"loaded": 0, "total": 0}
 
-            page.controls.clear()
-            page.add(
-                ft.Container(
-                    content=ft.Column(
-                        [
-                            build_logo(72),
-                            ft.ProgressRing(color=ACCENT),
-                            ft.Text(f"Logged in as {user['display_name']}", color=FG, size=14),
-                            ft.Text("Fetching liked songs...", color=FG_DIM, size=12),
-                        ],
-                        horizontal_alignment=ft.CrossAxisAlignment.CENTER,
-                        alignment=ft.MainAxisAlignment.CENTER,
-                        spacing=8,
-                    ),
-                    expand=True,
-                    alignment=ft.Alignment(0, 0),
+                def on_fetch_progress(loaded: int, total: int):
+                    fetch_progress["loaded"] = loaded
+                    fetch_progress["total"] = total
+
+                if known_tracks is None:
+                    fetch = functools.partial(track_source.fetch_all, on_progress=on_fetch_progress)
+                else:
+                    # Validated against page 0; usually no further page is requested.
+                    fetch = functools.partial(track_source.fetch_updates, known_tracks, on_progress=on_fetch_progress)
+                executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="liked-songs")
+                fetch_future = executor.submit(fetch)
+                executor.shutdown(wait=False)
+                fetch_started_at = time.monotonic()
+                while True:
+                    try:
+                        tracks = fetch_future.result(timeout=0.5)
+                        break
+                    except FutureTimeoutError:
+                        if not is_current():
+                            # The page request in flight finishes in the background; its result is dropped.
+                            return
+                        if fetch_progress["total"]:
+                            detail = f"Fetching liked songs... {fetch_progress['loaded']}/{fetch_progress['total']}"
+                        else:
+                            detail = f"Fetching liked songs... ({int(time.monotonic() - fetch_started_at)}s)"
+                        on_ui(show_status, detail)
+                    except Exception as e:
+                        logger.exception("Fetching liked songs failed")
+                        on_ui(show_error_view, e, "Fetching liked songs", cfg, 0)
+                        return
+                if tracks != known_tracks:
+                    liked_cache.save(user["id"], tracks)
+                logger.info(
+                    "Liked tracks loaded (count=%s, cached=%s)",
+                    len(tracks),
+                    known_tracks is not None,
                 )
-            )
-            page.update()
 
-            track_source = SpotifyTrackAdapter(sp)
-            tracks = track_source.fetch_all()
-            logger.info("Liked tracks loaded (count=%s)", len(tracks))
+                if not is_current():
+                    return
+
+                on_ui(show_launcher, cfg, sp, user, tracks)
+
+            threading.Thread(target=_prepare_launcher, daemon=True).start()
+
+        def show_launcher(cfg: dict, sp, user: dict, tracks: list):
+            """Build the pre-analysis launcher once Spotify data is in (runs on the page's event loop)."""
+            from src.adapters.spotify.playlist_adapter import SpotifyPlaylistAdapter
 
             if not tracks:
                 page.controls.clear()
@@ -501,17 +794,19 @@ def run_app():
                 page.update()
                 return
 
+            simulation_mode = bool(cfg.get("simulation_mode", False)) or _is_truthy(os.getenv(SIMULATION_ENV_VAR, ""))
+
             # Build classifier adapter
             provider = cfg.get("llm_provider", DEFAULT_PROVIDER)
             api_key = cfg.get("llm_api_key", "")
             model = cfg.get("llm_model", "") or PROVIDERS[provider]["default_model"]
 
-            if provider == "anthropic":
-                from src.adapters.classifier.anthropic_adapter import AnthropicClassifierAdapter
-                classifier = AnthropicClassifierAdapter(api_key=api_key, model=model, themes=THEMES_DICT)
-            else:
-                from src.adapters.classifier.openai_adapter import OpenAIClassifierAdapter
-                classifier = OpenAIClassifierAdapter(api_key=api_key, model=model, themes=THEMES_DICT)
+            # One bound on parallel LLM requests for the launcher and the session's preload alike.
+            classifier = BatchingClassifierAdapter(
+                FACTORIES[provider](api_key=api_key, model=model, themes=THEMES_DICT),
+                max_concurrency=int(cfg.get("llm_max_concurrency", DEFAULT_MAX_CONCURRENCY)),
+            )
+            launch_state["closers"].append(classifier.close)
 
             def start_session(audit_mode: bool):
                 cfg["simulation_mode"] = audit_mode
@@ -521,9 +816,8 @@ def run_app():
                     playlist = DryRunPlaylistAdapter()
                 else:
                     playlist = SpotifyPlaylistAdapter(sp, THEMES_DICT)
-                progress = JsonProgressAdapter()
+                progress = DebouncedProgressAdapter(JsonProgressAdapter())
 
-                from src.ui.classify_view import ClassifyView
                 view = ClassifyView(
                     page=page,
                     tracks=tracks,
@@ -534,8 +828,10 @@ def run_app():
                     simulation_mode=audit_mode,
                     on_back_to_step2=lambda: launch_classification(),
                 )
+                launch_state["closers"] += [view.close, progress.close]
 
                 page.on_keyboard_event = view.handle_keyboard
+                launcher_resize.cancel()
                 page.on_resized = view.handle_resize
                 page.controls.clear()
                 page.add(view)
@@ -607,6 +903,9 @@ def run_app():
                 "has_run": False,
                 "completed": False,
                 "ai_animating": False,
+                "animation_active": False,
+                "ui_ticking": False,
+                "ui_dirty": False,
             }
 
             start_button = ft.ElevatedButton("Start analysis", bgcolor=ACCENT, color="white")
@@ -622,6 +921,48 @@ def run_app():
                 if len(analysis_events.controls) > RUNNER_EVENT_MAX:
                     analysis_events.controls.pop(0)
 
+            def _batch_event(done_idx: int, inflight_idx: int, inflight_size: int):
+                """Report the last completed batch and the next in-flight batch as a single event."""
+                batch_total = max(analysis_state["batch_total"], 1)
+                parts = []
+                if done_idx:
+                    parts.append(
+                        f"Batch {done_idx}/{batch_total} completed "
+                        f"({len(analysis_state['processed_ids'])}/{analysis_total} tracks)."
+                    )
+                if inflight_idx:
+                    parts.append(f"Batch {inflight_idx}/{batch_total} in progress ({inflight_size} tracks).")
+                _push_event(" ".join(parts), ACCENT if inflight_idx else RUNNER_DONE_TEXT)
+
+            def _mark_dirty():
+                analysis_state["ui_dirty"] = True
+
+            async def _request_flush():
+                _mark_dirty()
+                await asyncio.sleep(0)
+
+            async def _ui_ticker():
+                """Flush pending UI changes at most once per frame while the analysis animates."""
+                if analysis_state["ui_ticking"]:
+                    return
+                analysis_state["ui_ticking"] = True
+                try:
+                    while analysis_state["animation_active"]:
+                        if analysis_state["ui_dirty"]:
+                            analysis_state["ui_dirty"] = False
+                            page.update()
+                        await asyncio.sleep(UI_FRAME_INTERVAL)
+                finally:
+                    analysis_state["ui_ticking"] = False
+                    if analysis_state["ui_dirty"]:
+                        analysis_state["ui_dirty"] = False
+                        page.update()
+
+            def _start_animation():
+                analysis_state["animation_active"] = True
+                page.run_task(_ui_ticker)
+                page.run_task(_animate_ai_title)
+
             async def _animate_ai_title():
                 if analysis_state["ai_animating"]:
                     return
@@ -634,22 +975,25 @@ def run_app():
                 ]
                 tick = 0
                 try:
-                    while analysis_state["running"] and not analysis_state["paused"]:
+                    while (
+                        analysis_state["running"]
+                        and not analysis_state["paused"]
+                        and analysis_state["animation_active"]
+                    ):
                         base = slogans[tick % len(slogans)]
                         dots = "." * ((tick % 3) + 1)
                         ai_activity_title.value = f"{base}{dots}"
                         ai_activity_title.color = ACCENT
-                        page.update()
+                        await _request_flush()
                         tick += 1
                         await asyncio.sleep(0.45)
                 finally:
                     analysis_state["ai_animating"] = False
 
             def _best_suggestion_label(track_id: str) -> str:
-                suggestions = classifier.get_suggestions(track_id)
-                if not suggestions:
+                best = classifier.best_suggestion(track_id)
+                if best is None:
                     return "analysis in progress"
-                best = max(suggestions, key=lambda suggestion: suggestion.confidence)
                 theme = THEMES.get(best.theme_key)
                 theme_name = theme.name if theme else best.theme_key
                 return f"{theme_name} ({best.confidence:.0%})"
@@ -764,14 +1108,17 @@ def run_app():
                 cancel_button.text = "Canceling..." if analysis_state["cancel_requested"] else "Cancel"
                 analysis_activity.visible = analysis_state["running"]
 
-                page.update()
+                if analysis_state["animation_active"]:
+                    _mark_dirty()
+                else:
+                    page.update()
 
             async def _run_analysis():
                 remaining = tracks[resume_index:]
                 analysis_state["batch_total"] = (
                     (len(remaining) + PRE_ANALYSIS_BATCH_SIZE - 1) // PRE_ANALYSIS_BATCH_SIZE if remaining else 0
                 )
-                started_at = time.perf_counter()
+                t0 = time.monotonic()
                 _push_event(
                     f"Pre-analysis started: {analysis_total} tracks to process, {analysis_state['batch_total']} batches.",
                     ACCENT,
@@ -783,6 +1130,8 @@ def run_app():
                     analysis_state["batch_total"],
                 )
 
+                # Completed batch not yet reported; folded into the next batch's start event.
+                unreported_done = 0
                 try:
                     for start in range(resume_index, len(tracks), PRE_ANALYSIS_BATCH_SIZE):
                         current_batch_number = ((start - resume_index) // PRE_ANALYSIS_BATCH_SIZE) + 1
@@ -797,39 +1146,27 @@ def run_app():
                         analysis_state["active_batch"] = current_batch_number
                         analysis_state["current_ids"] = [track.id for track in batch]
                         analysis_state["next_index"] = min(start + PRE_ANALYSIS_BATCH_SIZE, len(tracks))
-                        _push_event(
-                            f"Batch {current_batch_number}/{max(analysis_state['batch_total'], 1)} in progress ({len(batch)} tracks).",
-                            ACCENT,
-                        )
-                        logger.info(
-                            "Batch %s/%s started (size=%s, next_index=%s)",
-                            current_batch_number,
-                            max(analysis_state["batch_total"], 1),
-                            len(batch),
-                            analysis_state["next_index"],
-                        )
+                        _batch_event(unreported_done, current_batch_number, len(batch))
+                        unreported_done = 0
                         _refresh_track_runner()
 
-                        await asyncio.to_thread(classifier.classify_batch, batch)
+                        await classifier.classify_batch_async(batch)
 
                         analysis_state["processed_ids"].extend([track.id for track in batch])
                         analysis_state["current_ids"] = []
                         analysis_state["batch_done"] = current_batch_number
-                        _push_event(
-                            f"Batch {current_batch_number}/{max(analysis_state['batch_total'], 1)} completed "
-                            f"({len(analysis_state['processed_ids'])}/{analysis_total} tracks).",
-                            RUNNER_DONE_TEXT,
-                        )
-                        logger.info(
-                            "Batch %s/%s completed (processed=%s/%s)",
-                            current_batch_number,
-                            max(analysis_state["batch_total"], 1),
-                            len(analysis_state["processed_ids"]),
-                            analysis_total,
-                        )
-                        _refresh_track_runner()
+                        unreported_done = current_batch_number
+                        if analysis_state["paused"] or analysis_state["cancel_requested"]:
+                            # No next batch will start soon: report the completion right away.
+                            _batch_event(unreported_done, 0, 0)
+                            unreported_done = 0
+                            _refresh_track_runner()
+
+                    if unreported_done:
+                        _batch_event(unreported_done, 0, 0)
                 except Exception as error:
                     analysis_state["running"] = False
+                    analysis_state["animation_active"] = False
                     analysis_state["completed"] = False
                     _push_event(f"Analysis error: {str(error)[:120]}", DANGER)
                     logger.exception("Pre-analysis failed")
@@ -838,6 +1175,7 @@ def run_app():
                     return
 
                 analysis_state["running"] = False
+                analysis_state["animation_active"] = False
                 analysis_state["paused"] = False
                 analysis_state["current_ids"] = []
                 analysis_state["active_batch"] = 0
@@ -845,11 +1183,12 @@ def run_app():
                     not analysis_state["cancel_requested"]
                     and len(analysis_state["processed_ids"]) >= analysis_total > 0
                 )
+                elapsed = time.monotonic() - t0
                 if analysis_state["cancel_requested"]:
                     _push_event("Pre-analysis canceled by user.", DANGER)
                 elif analysis_state["completed"]:
                     _push_event(
-                        f"Pre-analysis completed in {time.perf_counter() - started_at:.1f}s.",
+                        f"Pre-analysis completed in {elapsed:.1f}s.",
                         RUNNER_DONE_TEXT,
                     )
                 logger.info(
@@ -857,7 +1196,7 @@ def run_app():
                     analysis_state["completed"],
                     len(analysis_state["processed_ids"]),
                     analysis_total,
-                    time.perf_counter() - started_at,
+                    elapsed,
                 )
                 _refresh_track_runner()
                 if analysis_state["completed"]:
@@ -887,8 +1226,8 @@ def run_app():
                 analysis_state["batch_total"] = (
                     (analysis_total + PRE_ANALYSIS_BATCH_SIZE - 1) // PRE_ANALYSIS_BATCH_SIZE if analysis_total else 0
                 )
+                _start_animation()
                 _refresh_track_runner()
-                page.run_task(_animate_ai_title)
                 page.run_task(_run_analysis)
 
             def on_pause_analysis(_):
@@ -897,15 +1236,18 @@ def run_app():
                 analysis_state["paused"] = not analysis_state["paused"]
                 _push_event("Analysis paused." if analysis_state["paused"] else "Analysis resumed.", FG_DIM)
                 logger.info("Analysis pause toggled (paused=%s)", analysis_state["paused"])
+                if analysis_state["paused"]:
+                    analysis_state["animation_active"] = False
+                else:
+                    _start_animation()
                 _refresh_track_runner()
-                if not analysis_state["paused"]:
-                    page.run_task(_animate_ai_title)
 
             def on_cancel_analysis(_):
                 if not analysis_state["running"]:
                     return
                 analysis_state["cancel_requested"] = True
                 analysis_state["paused"] = False
+                analysis_state["animation_active"] = False
                 _push_event("Cancellation requested. Current batch will finish, then stop.", DANGER)
                 logger.info("Analysis cancellation requested")
                 _refresh_track_runner()
@@ -994,6 +1336,9 @@ def run_app():
                     ),
                 )
 
+            # Kept across relayouts; only its size changes with the window.
+            launcher_logo = build_logo(READY_LOGO_SIZE)
+
             def _build_launcher_content() -> list[ft.Control]:
                 window_width = int(getattr(page.window, "width", 0) or 980)
                 compact = window_width < 980
@@ -1055,7 +1400,7 @@ def run_app():
                             ft.Container(
                                 width=content_width,
                                 alignment=ft.Alignment(0, 0),
-                                content=build_logo(logo_size),
+                                content=resize_logo(launcher_logo, logo_size),
                             ),
                             build_section("Connection status", account_controls, width=content_width),
                         ],
@@ -1076,7 +1421,7 @@ def run_app():
                             ft.Container(
                                 width=logo_block_width,
                                 alignment=ft.Alignment(0, 0),
-                                content=build_logo(logo_size),
+                                content=resize_logo(launcher_logo, logo_size),
                             ),
                             build_section("Connection status", account_controls, width=connection_width),
                         ],
@@ -1149,19 +1494,25 @@ def run_app():
                 )
             )
 
-            def on_launcher_resized(_e: ft.ControlEvent):
+            def relayout_launcher(_e: ft.ControlEvent | None = None):
                 launcher_column.controls = _build_launcher_content()
                 page.update()
 
-            session_mode.on_change = on_launcher_resized
+            def on_launcher_resized(_e: ft.ControlEvent):
+                # A window drag fires a burst of events; lay out once it settles.
+                launcher_resize(relayout_launcher)
+
+            launcher_resize = Debouncer()
+            # Leaving the launcher must not let a pending relayout redraw over the next screen.
+            launch_state["closers"].append(launcher_resize.cancel)
+            session_mode.on_change = relayout_launcher
             page.on_resized = on_launcher_resized
             _push_event("Pre-analysis is ready. Start analysis to see live events.", FG_DIM)
             _refresh_track_runner()
 
         def _check_for_update():
             """Run update check in background thread, show banner if newer version exists."""
-            from src.usecases.check_update import CheckUpdateUseCase
-            info = CheckUpdateUseCase().execute()
+            info = _once("update-check", CheckUpdateUseCase().execute_cached)
             if info:
                 banner = ft.Banner(
                     bgcolor=BG_CARD,
@@ -1197,7 +1548,6 @@ def run_app():
         if not bool(cfg.get("legal_acknowledged", False)):
             show_legal_gate()
         elif not config.is_configured():
-            from src.ui.setup_view import SetupView
             setup = SetupView(
                 page=page,
                 config=config,
@@ -1205,6 +1555,7 @@ def run_app():
                 on_cancel=show_legal_gate,
             )
             setup.expand = True
+            launch_state["closers"].append(setup.close)
             page.add(setup)
         else:
             launch_classification()
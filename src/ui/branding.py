@@ -1,24 +1,29 @@
 """Shared branding controls for the Flet UI."""
 
+import functools
 from pathlib import Path
 
 import flet as ft
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 BRANDING_DIR = PROJECT_ROOT / "assets" / "branding"
-UI_LOGO_CANDIDATES = [
+UI_LOGO_CANDIDATES = (
     BRANDING_DIR / "logo-in-app.png",
-]
-MARK_LOGO_CANDIDATES = [
+)
+MARK_LOGO_CANDIDATES = (
     BRANDING_DIR / "logo-mark.png",
     BRANDING_DIR / "icon.png",
-]
-APP_ICON_CANDIDATES = [
+)
+APP_ICON_CANDIDATES = (
     BRANDING_DIR / "icon.png",
-]
+)
+# Assets are 1024px; decode at display size (x2 for HiDPI) instead of full resolution.
+LOGO_DECODE_SCALE = 2
 
 
-def _first_existing_path(candidates: list[Path]) -> str:
+@functools.lru_cache(maxsize=None)
+def _first_existing_path(candidates: tuple[Path, ...]) -> str:
+    # Bundled assets do not appear or vanish while the app runs; stat each list once.
     for path in candidates:
         if path.exists():
             return str(path)
@@ -40,11 +45,20 @@ def app_icon_src() -> str:
     return _first_existing_path(APP_ICON_CANDIDATES)
 
 
+def _decode_size(size: int) -> int:
+    return int(size * LOGO_DECODE_SCALE)
+
+
+def _logo_image(src: str, size: int) -> ft.Image:
+    decode = _decode_size(size)
+    return ft.Image(src=src, width=size, height=size, cache_width=decode, cache_height=decode)
+
+
 def build_logo(size: int = 72) -> ft.Control:
     """Return in-app logo with a safe fallback when asset is missing."""
     src = logo_ui_src() or logo_mark_src()
     if src:
-        return ft.Image(src=src, width=size, height=size)
+        return _logo_image(src, size)
     return ft.Container(width=size, height=size)
 
 
@@ -52,10 +66,19 @@ def build_logo_mark(size: int = 72) -> ft.Control:
     """Return compact symbol logo for small placements."""
     src = logo_mark_src()
     if src:
-        return ft.Image(src=src, width=size, height=size)
+        return _logo_image(src, size)
     return ft.Container(width=size, height=size)
 
 
+def resize_logo(logo: ft.Control, size: int) -> ft.Control:
+    """Resize a logo from build_logo/build_logo_mark in place instead of building a new one."""
+    logo.width = size
+    logo.height = size
+    if isinstance(logo, ft.Image):
+        logo.cache_width = logo.cache_height = _decode_size(size)
+    return logo
+
+
 def responsive_logo_size(page: ft.Page, small: int = 72, medium: int = 100, large: int = 128) -> int:
     """Pick a logo size from the current window width."""
     width = int(getattr(page.window, "width", 0) or 0)
@@ -1,6 +1,10 @@
 """Flet-based classification view with queue and action-focused UX."""
 
+import queue
 import threading
+import time
+from functools import partial
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from typing import Callable
 
 import flet as ft
@@ -12,6 +16,7 @@ from src.ui.theme import ACCENT, BG, BG_CARD, BG_INPUT, BORDER, DANGER, FG, FG_D
 from src.ui.workflow_header import build_workflow_header
 from src.usecases.classify_track import ClassifyTrackUseCase
 from src.usecases.export_session import ExportSessionUseCase
+from src.usecases.playlist_io import build_playlist_io_pool
 from src.usecases.resume_session import ResumeSessionUseCase
 from src.usecases.undo_decision import UndoDecisionUseCase
 
@@ -19,6 +24,11 @@ DEFAULT_WINDOW_PAST = 3
 DEFAULT_WINDOW_FUTURE = 3
 PRELOAD_LOOKAHEAD = 20
 PRELOAD_BATCH_SIZE = 10
+PRELOAD_CONCURRENCY = 3
+PRELOAD_POLL_SECONDS = 0.1
+COVER_PREFETCH_COUNT = 3
+UPDATE_COALESCE_SECONDS = 0.016
+STATUS_PUSH_INTERVAL_SECONDS = 0.5
 
 
 class ClassifyView(ft.Column):
@@ -40,6 +50,19 @@ class ClassifyView(ft.Column):
         self.bgcolor = BG
         self.tracks = tracks
         self.themes = themes
+        self._theme_name_by_key = {key: theme.name for key, theme in themes.items()}
+        self._track_contexts = [self._build_track_context(track) for track in tracks]
+        self._track_display = [f"{track.artist} - {track.name}" for track in tracks]
+        self._track_artist_album = [f"{track.artist} - {track.album}" for track in tracks]
+        # Theme shortcuts win over the built-in keys, as they always have.
+        self._key_handlers: dict[str, Callable[[], None]] = {
+            "s": self._skip,
+            "arrow left": self._undo,
+            "escape": self._pause,
+        }
+        self._key_handlers.update(
+            (theme.shortcut.lower(), partial(self._decide, key)) for key, theme in themes.items()
+        )
         self.simulation_mode = simulation_mode
         self.on_back_to_step2 = on_back_to_step2
 
@@ -50,17 +73,37 @@ class ClassifyView(ft.Column):
         self._apply_layout_flags()
 
         # Use cases
-        self.classify_uc = ClassifyTrackUseCase(classifier, playlist, progress)
-        self.undo_uc = UndoDecisionUseCase(playlist, progress)
+        self._io_pool = build_playlist_io_pool()
+        self.classify_uc = ClassifyTrackUseCase(classifier, playlist, progress, io_pool=self._io_pool)
+        self.undo_uc = UndoDecisionUseCase(playlist, progress, io_pool=self._io_pool)
         self.export_uc = ExportSessionUseCase(progress)
         resume_uc = ResumeSessionUseCase(progress)
         self.session: ClassificationSession = resume_uc.execute(tracks)
         self.classifier = classifier
+        self._theme_counts: dict[str, int] = {}
+        self._skipped = 0
+        self._recount_stats()
+        self._decision_tags: dict[str, str] = {}
 
         self._analysis_job_id = 0
         self._analysis_track_ids: list[str] = []
+        self._analysis_done = 0
         self._analysis_running = False
         self._analysis_error = ""
+        self._last_status_push = 0.0
+        self._status_trailer: threading.Timer | None = None
+        # Guards the job id, the done counter and the push throttle: workers and the UI share them.
+        self._analysis_lock = threading.Lock()
+        self._preload_executor = ThreadPoolExecutor(max_workers=PRELOAD_CONCURRENCY, thread_name_prefix="preload")
+        self._preload_queue: queue.Queue[tuple[int, list[Track]] | None] = queue.Queue(maxsize=1)
+        self._closed = False
+        self._preload_thread = threading.Thread(target=self._preload_worker, daemon=True, name="preload-worker")
+        self._preload_thread.start()
+
+        self._update_pending = False
+        self._update_full = False
+        self._update_targets: set[ft.Control] = set()
+        self._update_lock = threading.Lock()
 
         # UI state refs
         self.progress_bar = ft.ProgressBar(value=0, bgcolor=BG_INPUT, color=ACCENT, width=float("inf"))
@@ -68,7 +111,7 @@ class ClassifyView(ft.Column):
         self.stats_label = ft.Text("", size=11, color=FG_DIM)
         self.analysis_label = ft.Text("", size=11, color=FG_DIM)
         self.workflow_context_label = ft.Text("", size=11, color=FG_DIM)
-        destination_names = ", ".join(theme.name for theme in self.themes.values())
+        destination_names = ", ".join(self._theme_name_by_key.values())
         self.ux_help_label = ft.Text(
             f"{destination_names} are destination playlists. "
             "[S] keeps this track unclassified. [<-] undoes the previous decision.",
@@ -85,13 +128,20 @@ class ClassifyView(ft.Column):
             visible=False,
         )
         self.current_cover_placeholder = ft.Text("No cover image", size=11, color=FG_DIM, visible=True)
+        self._title_text = self._build_title_text("", "title")
+        self._artist_text = self._build_artist_text("", "artist")
+        self._last_rendered_id: str | None = None
+        self._last_idx: int | None = None
+        self._last_sig: tuple[int | None, int | None] = (None, None)
+        self._last_sugg_key: tuple[str, str, float] | None = None
+        self._last_sugg_text = ""
         self.current_title_switcher = ft.AnimatedSwitcher(
-            content=ft.Text("", size=20, weight=ft.FontWeight.BOLD, color=FG, text_align=ft.TextAlign.CENTER),
+            content=self._title_text,
             duration=220,
             transition=ft.AnimatedSwitcherTransition.SCALE,
         )
         self.current_artist_switcher = ft.AnimatedSwitcher(
-            content=ft.Text("", size=14, color=FG_DIM, text_align=ft.TextAlign.CENTER),
+            content=self._artist_text,
             duration=180,
             transition=ft.AnimatedSwitcherTransition.FADE,
         )
@@ -102,26 +152,88 @@ class ClassifyView(ft.Column):
         self.future_labels: list[ft.Text] = []
         self._sync_window_labels()
 
+        # Upcoming covers rendered invisibly so the client has them cached before they are shown.
+        self._cover_prefetch = [
+            ft.Image(src="", width=1, height=1, opacity=0, visible=False) for _ in range(COVER_PREFETCH_COUNT)
+        ]
+        self._cover_prefetch_row = ft.Row(self._cover_prefetch, height=1, spacing=0)
+
         self.snack = ft.SnackBar(content=ft.Text(""))
+        self._sections: dict | None = None
+        self._destination_cards: list[ft.Container] = []
+        self._header: ft.Container | None = None
+        self._header_compact: bool | None = None
 
         self._build_ui()
         self._refresh_display()
         self._preload_llm()
 
     def _build_ui(self):
-        header = ft.Container(
-            content=build_workflow_header(
-                page=self._page,
-                current_step=2,
-                subtitle="Step 2/2 - Track qualification",
+        if self._sections is None:
+            self._sections = self._build_sections()
+        sections = self._sections
+
+        if self._header_compact != self.is_compact_layout:
+            self._header = ft.Container(
+                content=build_workflow_header(
+                    page=self._page,
+                    current_step=2,
+                    subtitle="Step 2/2 - Track qualification",
+                    width=float("inf"),
+                    mode_label="Audit" if self.simulation_mode else "Standard",
+                    step_labels=["Pre-analysis", "Qualification"],
+                ),
                 width=float("inf"),
-                mode_label="Audit" if self.simulation_mode else "Standard",
-                step_labels=["Pre-analysis", "Qualification"],
-            ),
-            width=float("inf"),
-            padding=ft.padding.only(top=8, bottom=8),
-        )
+                padding=ft.padding.only(top=8, bottom=8),
+            )
+            self._header_compact = self.is_compact_layout
+
+        side_width = None if self.is_compact_layout else 210
+        side_expand = 1 if self.is_compact_layout else None
+        left_panel = sections["left_panel"]
+        right_panel = sections["right_panel"]
+        center_panel = sections["center_panel"]
+        for panel in (left_panel, right_panel):
+            panel.width = side_width
+            panel.expand = side_expand
+        left_panel.content.controls = [*sections["left_heading"], *self.past_labels]
+        right_panel.content.controls = [*sections["right_heading"], *self.future_labels]
+        center_panel.width = None if self.is_compact_layout else 440
+        center_panel.expand = None if self.is_compact_layout else 1
+
+        card_width = None if self.is_compact_layout else 300
+        for card in self._destination_cards:
+            card.width = card_width
+
+        if self.is_compact_layout:
+            lanes_content: ft.Control = ft.Column(
+                [
+                    center_panel,
+                    ft.Row([left_panel, right_panel], spacing=8, wrap=True),
+                ],
+                spacing=8,
+            )
+        else:
+            lanes_content = ft.Row(
+                [left_panel, center_panel, right_panel],
+                spacing=10,
+                vertical_alignment=ft.CrossAxisAlignment.START,
+            )
+        sections["lanes_section"].content = lanes_content
+
+        self.controls = [
+            self._header,
+            sections["context_row"],
+            sections["progress_row"],
+            sections["lanes_section"],
+            sections["actions_section"],
+            sections["bottom_row"],
+            self._cover_prefetch_row,
+            self.snack,
+        ]
 
+    def _build_sections(self) -> dict:
+        """Controls that survive layout changes; _build_ui only adjusts their sizes."""
         context_controls: list[ft.Control] = [
             self.workflow_context_label,
             ft.Container(expand=True),
@@ -132,7 +244,7 @@ class ClassifyView(ft.Column):
             context_controls.append(
                 ft.TextButton(
                     "Back to pre-analysis",
-                    on_click=lambda _: self.on_back_to_step2(),
+                    on_click=lambda _: self._back_to_step2(),
                     style=ft.ButtonStyle(color=FG_DIM),
                 )
             )
@@ -151,30 +263,20 @@ class ClassifyView(ft.Column):
             padding=ft.padding.symmetric(horizontal=20, vertical=8),
         )
 
-        side_width = None if self.is_compact_layout else 210
-        center_expand = not self.is_compact_layout
-
+        left_heading = [
+            ft.Text("<- Already processed", size=12, color=FG_DIM, weight=ft.FontWeight.BOLD),
+            ft.Text("Previous decisions", size=10, color=FG_DIM),
+            ft.Container(height=4),
+        ]
         left_panel = ft.Container(
-            width=side_width,
-            expand=1 if self.is_compact_layout else None,
             bgcolor=BG_CARD,
             border=ft.border.all(1, BORDER),
             border_radius=8,
             padding=10,
-            content=ft.Column(
-                [
-                    ft.Text("<- Already processed", size=12, color=FG_DIM, weight=ft.FontWeight.BOLD),
-                    ft.Text("Previous decisions", size=10, color=FG_DIM),
-                    ft.Container(height=4),
-                    *self.past_labels,
-                ],
-                spacing=3,
-            ),
+            content=ft.Column(spacing=3),
         )
 
         center_panel = ft.Container(
-            width=None if self.is_compact_layout else 440,
-            expand=1 if center_expand else None,
             bgcolor=BG_CARD,
             border=ft.border.all(2, ACCENT),
             border_radius=8,
@@ -198,45 +300,22 @@ class ClassifyView(ft.Column):
             ),
         )
 
+        right_heading = [
+            ft.Text("Coming next ->", size=12, color=FG_DIM, weight=ft.FontWeight.BOLD),
+            ft.Text("Upcoming queue", size=10, color=FG_DIM),
+            ft.Container(height=4),
+        ]
         right_panel = ft.Container(
-            width=side_width,
-            expand=1 if self.is_compact_layout else None,
             bgcolor=BG_CARD,
             border=ft.border.all(1, BORDER),
             border_radius=8,
             padding=10,
-            content=ft.Column(
-                [
-                    ft.Text("Coming next ->", size=12, color=FG_DIM, weight=ft.FontWeight.BOLD),
-                    ft.Text("Upcoming queue", size=10, color=FG_DIM),
-                    ft.Container(height=4),
-                    *self.future_labels,
-                ],
-                spacing=3,
-            ),
+            content=ft.Column(spacing=3),
         )
 
-        if self.is_compact_layout:
-            lanes_content: ft.Control = ft.Column(
-                [
-                    center_panel,
-                    ft.Row([left_panel, right_panel], spacing=8, wrap=True),
-                ],
-                spacing=8,
-            )
-        else:
-            lanes_content = ft.Row(
-                [left_panel, center_panel, right_panel],
-                spacing=10,
-                vertical_alignment=ft.CrossAxisAlignment.START,
-            )
+        lanes_section = ft.Container(padding=ft.padding.symmetric(horizontal=16, vertical=6))
 
-        lanes_section = ft.Container(
-            content=lanes_content,
-            padding=ft.padding.symmetric(horizontal=16, vertical=6),
-        )
-
-        destination_cards = [self._build_destination_card(key, theme) for key, theme in self.themes.items()]
+        self._destination_cards = [self._build_destination_card(key, theme) for key, theme in self.themes.items()]
         actions_section = ft.Container(
             content=ft.Column(
                 [
@@ -247,7 +326,7 @@ class ClassifyView(ft.Column):
                         color=FG_DIM,
                         text_align=ft.TextAlign.CENTER,
                     ),
-                    ft.Row(destination_cards, alignment=ft.MainAxisAlignment.CENTER, spacing=10, wrap=True),
+                    self._build_destination_row(),
                     ft.Row(
                         [
                             ft.ElevatedButton(
@@ -288,20 +367,28 @@ class ClassifyView(ft.Column):
             padding=ft.padding.symmetric(horizontal=20, vertical=8),
         )
 
-        self.controls = [
-            header,
-            context_row,
-            progress_row,
-            lanes_section,
-            actions_section,
-            bottom_row,
-            self.snack,
-        ]
-
-    def _refresh_display(self):
+        return {
+            "context_row": context_row,
+            "progress_row": progress_row,
+            "left_heading": left_heading,
+            "left_panel": left_panel,
+            "center_panel": center_panel,
+            "right_heading": right_heading,
+            "right_panel": right_panel,
+            "lanes_section": lanes_section,
+            "actions_section": actions_section,
+            "bottom_row": bottom_row,
+        }
+
+    def _refresh_display(self, force: bool = False):
         total = len(self.tracks)
         idx = self.session.current_index
         decided = self.session.decided_count
+        sig = (idx, decided)
+        if sig == self._last_sig and not force:
+            self._refresh_suggestion_only()
+            return
+        self._last_sig = sig
 
         self.progress_bar.value = decided / total if total > 0 else 0
         percent = int((decided / total) * 100) if total > 0 else 0
@@ -314,34 +401,36 @@ class ClassifyView(ft.Column):
             self._finish()
             return
 
-        for i, lbl in enumerate(self.past_labels):
-            past_idx = idx - self.window_past + i
-            if 0 <= past_idx < total:
-                past_track = self.tracks[past_idx]
-                decision = self.session.decision_for(past_track.id)
-                tag = self._decision_tag(decision)
-                lbl.value = f"{past_track.artist} - {past_track.name} {tag}".strip()
-            else:
-                lbl.value = ""
-
-        track = self.tracks[idx]
+        tracks = self.tracks
+        track_display = self._track_display
+        window_moved = idx != self._last_idx
+        if window_moved:
+            decision_for = self.session.decision_for
+            decision_tag = self._decision_tag
+            for lbl, offset in zip(self.past_labels, self._past_offsets):
+                past_idx = idx + offset
+                if 0 <= past_idx < total:
+                    tag = decision_tag(decision_for(tracks[past_idx].id))
+                    display = track_display[past_idx]
+                    lbl.value = f"{display} {tag}" if tag else display
+                else:
+                    lbl.value = ""
+
+        track = tracks[idx]
         self.current_position.value = f"Track {idx + 1} of {total}"
-        self.current_title_switcher.content = ft.Text(
-            track.name,
-            size=20,
-            weight=ft.FontWeight.BOLD,
-            color=FG,
-            text_align=ft.TextAlign.CENTER,
-            key=f"title-{track.id}-{idx}",
-        )
-        self.current_artist_switcher.content = ft.Text(
-            f"{track.artist} - {track.album}",
-            size=14,
-            color=FG_DIM,
-            text_align=ft.TextAlign.CENTER,
-            key=f"artist-{track.id}-{idx}",
-        )
-        self.current_context.value = self._build_track_context(track)
+        title = track.name
+        artist = self._track_artist_album[idx]
+        if self._last_rendered_id != track.id:
+            # A new control is what makes the switcher animate; same track only changes text.
+            self._title_text = self._build_title_text(title, f"title-{track.id}")
+            self._artist_text = self._build_artist_text(artist, f"artist-{track.id}")
+            self.current_title_switcher.content = self._title_text
+            self.current_artist_switcher.content = self._artist_text
+            self._last_rendered_id = track.id
+        else:
+            self._title_text.value = title
+            self._artist_text.value = artist
+        self.current_context.value = self._track_contexts[idx]
 
         if track.album_image_url:
             self.current_cover.src = track.album_image_url
@@ -351,38 +440,43 @@ class ClassifyView(ft.Column):
             self.current_cover.visible = False
             self.current_cover_placeholder.visible = True
 
-        suggestions = self.classifier.get_suggestions(track.id)
-        if suggestions:
-            best = max(suggestions, key=lambda suggestion: suggestion.confidence)
-            theme = self.themes.get(best.theme_key)
-            theme_name = theme.name if theme else best.theme_key
-            reasoning = best.reasoning.strip()
-            if len(reasoning) > 90:
-                reasoning = f"{reasoning[:87]}..."
-            self.suggestion_label.value = f"AI recommendation: {theme_name} ({best.confidence:.0%}) - {reasoning}"
+        self._refresh_suggestion(track)
+
+        if window_moved:
+            for lbl, offset in zip(self.future_labels, self._future_offsets):
+                future_idx = idx + offset
+                if future_idx < total:
+                    lbl.value = track_display[future_idx]
+                else:
+                    lbl.value = ""
+            self._prefetch_covers(idx + 1)
+            self._last_idx = idx
+
+    def _refresh_suggestion_only(self) -> None:
+        """Cheap refresh for when only AI suggestions may have changed."""
+        idx = self.session.current_index
+        if idx < len(self.tracks):
+            self._refresh_suggestion(self.tracks[idx])
+
+    def _refresh_suggestion(self, track: Track) -> None:
+        best = self.classifier.best_suggestion(track.id)
+        if best:
+            sugg_key = (track.id, best.theme_key, best.confidence)
+            if sugg_key != self._last_sugg_key:
+                theme_name = self._theme_name_by_key.get(best.theme_key, best.theme_key)
+                reasoning = best.reasoning.strip()
+                if len(reasoning) > 90:
+                    reasoning = f"{reasoning[:87]}..."
+                self._last_sugg_text = f"AI recommendation: {theme_name} ({best.confidence:.0%}) - {reasoning}"
+                self._last_sugg_key = sugg_key
+            self.suggestion_label.value = self._last_sugg_text
         else:
             self.suggestion_label.value = "AI recommendation: analyzing this track..."
 
-        for i, lbl in enumerate(self.future_labels):
-            future_idx = idx + 1 + i
-            if future_idx < total:
-                future_track = self.tracks[future_idx]
-                lbl.value = f"{future_track.artist} - {future_track.name}"
-            else:
-                lbl.value = ""
-
     def handle_keyboard(self, e: ft.KeyboardEvent):
-        for theme_key, theme in self.themes.items():
-            if e.key == theme.shortcut:
-                self._decide(theme_key)
-                return
-
-        if e.key.lower() == "s":
-            self._skip()
-        elif e.key == "Arrow Left":
-            self._undo()
-        elif e.key == "Escape":
-            self._pause()
+        handler = self._key_handlers.get(e.key.lower())
+        if handler:
+            handler()
 
     def handle_resize(self, _e: ft.ControlEvent):
         previous_state = (self.is_compact_layout, self.window_past, self.window_future, self.cover_size)
@@ -390,37 +484,57 @@ class ClassifyView(ft.Column):
         self._sync_window_labels()
         current_state = (self.is_compact_layout, self.window_past, self.window_future, self.cover_size)
         if current_state != previous_state:
+            self._last_idx = None
             self._build_ui()
-            self._refresh_display()
-            self.update()
+            self._refresh_display(force=True)
+            self._schedule_update()
 
     # Actions
 
+    def _on_destination_click(self, theme_key: str, _e: ft.ControlEvent):
+        self._decide(theme_key)
+
     def _decide(self, theme_key: str):
         if self.session.current_index >= len(self.tracks):
             return
         track = self.tracks[self.session.current_index]
+        existing = self.session.decision_for(track.id)
+        already_counted = existing is not None and theme_key in existing.themes
         self.classify_uc.execute(self.session, track, theme_key)
+        self._decision_tags.pop(track.id, None)
+        if not already_counted and theme_key in self._theme_counts:
+            self._theme_counts[theme_key] += 1
         self._refresh_display()
         self._preload_llm()
-        self.update()
+        self._schedule_update(*self._refresh_targets())
 
     def _skip(self):
         if self.session.current_index >= len(self.tracks):
             return
         track = self.tracks[self.session.current_index]
         self.classify_uc.skip(self.session, track)
+        self._skipped += 1
         self._refresh_display()
         self._preload_llm()
-        self.update()
+        self._schedule_update(*self._refresh_targets())
 
     def _undo(self):
-        self.undo_uc.execute(self.session)
+        undone = self.undo_uc.execute(self.session)
+        if undone is None:
+            return
+        self._count_decision(undone, -1)
+        self._decision_tags.pop(undone.track_id, None)
         self._refresh_display()
         self._preload_llm()
-        self.update()
+        self._schedule_update(*self._refresh_targets())
+
+    def _back_to_step2(self):
+        self.classify_uc.progress.flush()
+        self.close()
+        self.on_back_to_step2()
 
     def _pause(self):
+        self.classify_uc.progress.flush()
         self._show_snack("Progress saved. You can resume later.")
         self._page.window.close()
 
@@ -449,8 +563,7 @@ class ClassifyView(ft.Column):
         self._page.update()
 
     def _export(self):
-        path = self.export_uc.execute(self.session)
-        self._show_snack(f"CSV exported to {path}")
+        self._export_in_background(lambda path: f"CSV exported to {path}")
 
     def _show_disclaimer(self):
         def close_dialog(_):
@@ -467,11 +580,70 @@ class ClassifyView(ft.Column):
         self._page.update()
 
     def _finish(self):
-        path = self.export_uc.execute(self.session)
-        self._show_snack(f"All {len(self.tracks)} tracks classified! Exported to {path}")
+        self.classify_uc.progress.flush()
+        total = len(self.tracks)
+        self._export_in_background(lambda path: f"All {total} tracks classified! Exported to {path}")
+
+    def _export_in_background(self, message: Callable[[str], str]) -> None:
+        """Write the CSV off the event handler; the snack bar reports the path when done."""
+        snapshot = ClassificationSession(
+            current_index=self.session.current_index,
+            track_ids=self.session.track_ids,
+            decisions=list(self.session.decisions),
+        )
+
+        def _run():
+            try:
+                path = self.export_uc.execute(snapshot)
+            except OSError as error:
+                self._show_snack(f"CSV export failed: {error}")
+                return
+            self._show_snack(message(path))
+
+        # Not a daemon: closing the window right after must not cut the file short.
+        threading.Thread(target=_run, name="csv-export").start()
 
     # Helpers
 
+    def _schedule_update(self, *controls: ft.Control) -> None:
+        """Push pending control changes at most once per frame, whoever asked for it.
+
+        With controls, only those subtrees are diffed; without, the whole page is.
+        """
+        with self._update_lock:
+            if controls:
+                self._update_targets.update(controls)
+            else:
+                self._update_full = True
+            if self._update_pending:
+                return
+            self._update_pending = True
+        timer = threading.Timer(UPDATE_COALESCE_SECONDS, self._flush_update)
+        timer.daemon = True
+        timer.start()
+
+    def _flush_update(self) -> None:
+        with self._update_lock:
+            targets, self._update_targets = self._update_targets, set()
+            full, self._update_full = self._update_full, False
+            self._update_pending = False
+        if not self._page:
+            return
+        if full or any(control.uid is None for control in targets):
+            self._page.update()
+        else:
+            self._page.update(*targets)
+
+    def _refresh_targets(self) -> tuple[ft.Control, ...]:
+        """Subtrees a decision can change; header, actions and footer stay static."""
+        sections = self._sections
+        return (
+            sections["context_row"],
+            sections["progress_row"],
+            sections["lanes_section"],
+            self._cover_prefetch_row,
+        )
+
     def _apply_layout_flags(self) -> None:
         width = int(getattr(self._page.window, "width", 0) or 0)
         height = int(getattr(self._page.window, "height", 0) or 0)
@@ -496,9 +668,31 @@ class ClassifyView(ft.Column):
         while len(self.future_labels) > self.window_future:
             self.future_labels.pop()
 
+        self._past_offsets = tuple(range(-self.window_past, 0))
+        self._future_offsets = tuple(range(1, self.window_future + 1))
+
+    @staticmethod
+    def _build_title_text(value: str, key: str) -> ft.Text:
+        return ft.Text(value, size=20, weight=ft.FontWeight.BOLD, color=FG, text_align=ft.TextAlign.CENTER, key=key)
+
+    @staticmethod
+    def _build_artist_text(value: str, key: str) -> ft.Text:
+        return ft.Text(value, size=14, color=FG_DIM, text_align=ft.TextAlign.CENTER, key=key)
+
+    def _prefetch_covers(self, start: int) -> None:
+        upcoming = self.tracks[start : start + COVER_PREFETCH_COUNT]
+        for i, image in enumerate(self._cover_prefetch):
+            url = upcoming[i].album_image_url if i < len(upcoming) else None
+            image.src = url or ""
+            image.visible = bool(url)
+
+    def _build_destination_row(self) -> ft.Control:
+        if len(self._destination_cards) == 1:
+            return self._destination_cards[0]
+        return ft.Row(self._destination_cards, alignment=ft.MainAxisAlignment.CENTER, spacing=10, wrap=True)
+
     def _build_destination_card(self, theme_key: str, theme: Theme) -> ft.Container:
         return ft.Container(
-            width=300 if not self.is_compact_layout else None,
             bgcolor=BG_CARD,
             border=ft.border.all(1, BORDER),
             border_radius=8,
@@ -514,7 +708,7 @@ class ClassifyView(ft.Column):
                     ),
                     ft.ElevatedButton(
                         f"Classify here [{theme.shortcut}]",
-                        on_click=lambda _, selected_theme=theme_key: self._decide(selected_theme),
+                        on_click=partial(self._on_destination_click, theme_key),
                         bgcolor=ACCENT,
                         color="white",
                     ),
@@ -523,30 +717,30 @@ class ClassifyView(ft.Column):
             ),
         )
 
-    def _build_stats_label(self) -> str:
-        theme_counts = {theme_key: 0 for theme_key in self.themes}
-        skipped = 0
+    def _recount_stats(self) -> None:
+        self._theme_counts = {theme_key: 0 for theme_key in self.themes}
+        self._skipped = 0
         for decision in self.session.decisions:
-            if decision.skipped:
-                skipped += 1
-                continue
-            for theme_key in decision.themes:
-                if theme_key in theme_counts:
-                    theme_counts[theme_key] += 1
+            self._count_decision(decision, 1)
+
+    def _count_decision(self, decision: Decision, delta: int) -> None:
+        if decision.skipped:
+            self._skipped += delta
+            return
+        for theme_key in decision.themes:
+            if theme_key in self._theme_counts:
+                self._theme_counts[theme_key] += delta
 
-        parts = [f"{self.themes[theme_key].name}: {count}" for theme_key, count in theme_counts.items()]
-        return "Distribution: " + " | ".join(parts + [f"Skipped: {skipped}"])
+    def _build_stats_label(self) -> str:
+        counts = (f"{self._theme_name_by_key[theme_key]}: {count}" for theme_key, count in self._theme_counts.items())
+        return f"Distribution: {' | '.join((*counts, f'Skipped: {self._skipped}'))}"
 
     def _refresh_analysis_status(self) -> None:
         if not self._analysis_track_ids:
             self.analysis_label.value = "AI preload: idle"
             return
 
-        done = 0
-        for track_id in self._analysis_track_ids:
-            if self.classifier.get_suggestions(track_id):
-                done += 1
-
+        done = self._analysis_done
         total = len(self._analysis_track_ids)
         if self._analysis_error:
             self.analysis_label.value = f"AI preload: {done}/{total} (partial, {self._analysis_error})"
@@ -555,42 +749,140 @@ class ClassifyView(ft.Column):
         state = "running" if self._analysis_running else "ready"
         self.analysis_label.value = f"AI preload: {done}/{total} ({state})"
 
+    def _push_analysis_status(self) -> None:
+        """Refresh preload and suggestion labels from the worker, pushing at most every 500 ms."""
+        previous = (self.analysis_label.value, self.suggestion_label.value)
+        self._refresh_analysis_status()
+        self._refresh_suggestion_only()
+        if (self.analysis_label.value, self.suggestion_label.value) == previous:
+            return
+        now = time.monotonic()
+        with self._analysis_lock:
+            wait_for = self._last_status_push + STATUS_PUSH_INTERVAL_SECONDS - now
+            if wait_for > 0:
+                # Throttled: push whatever the labels say once the interval ends.
+                if self._status_trailer is None and not self._closed:
+                    self._status_trailer = threading.Timer(wait_for, self._push_trailing_status)
+                    self._status_trailer.daemon = True
+                    self._status_trailer.start()
+                return
+            self._last_status_push = now
+        self._schedule_update(self.analysis_label, self.suggestion_label)
+
+    def _push_trailing_status(self) -> None:
+        with self._analysis_lock:
+            self._status_trailer = None
+            self._last_status_push = time.monotonic()
+        self._refresh_analysis_status()
+        self._refresh_suggestion_only()
+        self._schedule_update(self.analysis_label, self.suggestion_label)
+
+    def _count_analysed(self, job_id: int, count: int) -> None:
+        with self._analysis_lock:
+            if job_id == self._analysis_job_id:
+                self._analysis_done += count
+
     def _preload_llm(self):
-        self._analysis_job_id += 1
-        job_id = self._analysis_job_id
+        if self._closed:
+            return
         start = self.session.current_index
         end = min(start + PRELOAD_LOOKAHEAD, len(self.tracks))
         batch = self.tracks[start:end]
-        self._analysis_track_ids = [track.id for track in batch]
-        self._analysis_running = True
+        pending = [track for track in batch if not self.classifier.get_suggestions(track.id)]
+        with self._analysis_lock:
+            # A worker still counting for the previous job sees the new id and stops counting.
+            self._analysis_job_id += 1
+            job_id = self._analysis_job_id
+            self._analysis_track_ids = [track.id for track in batch]
+            self._analysis_done = len(batch) - len(pending)
+        self._analysis_running = bool(pending)
         self._analysis_error = ""
         self._refresh_analysis_status()
+        if not pending:
+            return
 
-        def _run():
-            for i in range(0, len(batch), PRELOAD_BATCH_SIZE):
-                if job_id != self._analysis_job_id:
-                    return
-                chunk = batch[i : i + PRELOAD_BATCH_SIZE]
-                try:
-                    self.classifier.classify_batch(chunk)
-                except Exception as error:
-                    if job_id != self._analysis_job_id:
-                        return
-                    self._analysis_error = str(error)[:80]
-                    break
-
-                self._refresh_analysis_status()
-                if self._page:
-                    self._page.update()
+        self._replace_preload_request((job_id, pending))
+
+    def _replace_preload_request(self, request: tuple[int, list[Track]] | None) -> None:
+        try:
+            self._preload_queue.put_nowait(request)
+        except queue.Full:
+            # Only the UI thread produces, so after dropping the stale request there is room.
+            try:
+                self._preload_queue.get_nowait()
+            except queue.Empty:
+                pass
+            self._preload_queue.put_nowait(request)
+
+    def _preload_worker(self) -> None:
+        """Single long-lived consumer: always works on the most recent preload request."""
+        while True:
+            request = self._preload_queue.get()
+            if request is None:
+                return
+            job_id, batch = request
+            if job_id == self._analysis_job_id:
+                self._run_preload(job_id, batch)
 
+    def close(self) -> None:
+        """Stop the preload worker and release the view's pools when the session is left."""
+        if self._closed:
+            return
+        with self._analysis_lock:
+            self._closed = True
+            self._analysis_job_id += 1  # a running preload stops at its next poll
+            if self._status_trailer is not None:
+                self._status_trailer.cancel()
+                self._status_trailer = None
+        self._replace_preload_request(None)
+        self._preload_executor.shutdown(wait=False, cancel_futures=True)
+        # Queued playlist writes are user decisions: let them finish, the thread exits after.
+        self._io_pool.shutdown(wait=False)
+
+    def _run_preload(self, job_id: int, batch: list[Track]) -> None:
+        # Tracks answered since the request was queued are simply counted; tracks still
+        # in flight from an earlier window are joined by the classifier, not sent again.
+        futures: dict[Future, list[Track]] = {}
+        to_send: list[Track] = []
+        for track in batch:
+            if self.classifier.get_suggestions(track.id):
+                self._count_analysed(job_id, 1)
+            else:
+                to_send.append(track)
+        for i in range(0, len(to_send), PRELOAD_BATCH_SIZE):
+            chunk = to_send[i : i + PRELOAD_BATCH_SIZE]
+            try:
+                future = self._preload_executor.submit(self._classify_unanswered, chunk)
+            except RuntimeError:
+                return  # closed while this request was being dispatched
+            futures[future] = chunk
+
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, timeout=PRELOAD_POLL_SECONDS, return_when=FIRST_COMPLETED)
             if job_id != self._analysis_job_id:
+                # Leave running chunks alone: the newer window mostly overlaps and joins them.
                 return
-            self._analysis_running = False
-            self._refresh_analysis_status()
-            if self._page:
-                self._page.update()
+            for future in done:
+                error = future.exception()
+                if error is not None:
+                    self._analysis_error = str(error)[:80]
+                else:
+                    self._count_analysed(job_id, len(futures[future]))
+            if done:
+                self._push_analysis_status()
+
+        self._analysis_running = False
+        self._refresh_analysis_status()
+        self._refresh_suggestion_only()
+        self._schedule_update(self.analysis_label, self.suggestion_label)
 
-        threading.Thread(target=_run, daemon=True).start()
+    def _classify_unanswered(self, chunk: list[Track]) -> None:
+        # A chunk can wait in the pool while an overlapping one completes; in-flight
+        # tracks are deduplicated by the classifier, answered ones are dropped here.
+        missing = [track for track in chunk if not self.classifier.get_suggestions(track.id)]
+        if missing:
+            self.classifier.classify_batch(missing)
 
     def _build_track_context(self, track: Track) -> str:
         parts = []
@@ -614,8 +906,12 @@ class ClassifyView(ft.Column):
             return ""
         if decision.skipped:
             return "[skipped]"
-        names = [self.themes[theme_key].name for theme_key in decision.themes if theme_key in self.themes]
-        return f"[{', '.join(names)}]" if names else ""
+        tag = self._decision_tags.get(decision.track_id)
+        if tag is None:
+            names = [self._theme_name_by_key[key] for key in decision.themes if key in self._theme_name_by_key]
+            tag = f"[{', '.join(names)}]" if names else ""
+            self._decision_tags[decision.track_id] = tag
+        return tag
 
     def _show_snack(self, msg: str):
         self.snack.content = ft.Text(msg)
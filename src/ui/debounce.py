@@ -0,0 +1,31 @@
+"""Trailing-edge debounce for bursty Flet events such as window resizes."""
+
+from __future__ import annotations
+
+import threading
+from typing import Callable
+
+RESIZE_DEBOUNCE_SECONDS = 0.1
+
+
+class Debouncer:
+    """Run only the last scheduled callable, once no newer call arrived for ``delay`` seconds."""
+
+    def __init__(self, delay: float = RESIZE_DEBOUNCE_SECONDS):
+        self.delay = delay
+        self._timer: threading.Timer | None = None
+        self._lock = threading.Lock()
+
+    def __call__(self, fn: Callable[[], None]) -> None:
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(self.delay, fn)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def cancel(self) -> None:
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
@@ -1,7 +1,11 @@
 """Flet-based 3-step configuration wizard."""
 
 import asyncio
+import itertools
+import threading
 import webbrowser
+from functools import lru_cache, partial
+from pathlib import Path
 from typing import Callable, Optional
 
 import flet as ft
@@ -17,6 +21,7 @@ from src.adapters.cache.local_cache import (
 from src.adapters.classifier import PROVIDERS
 from src.domain.ports import ConfigPort
 from src.ui.branding import build_logo
+from src.ui.debounce import Debouncer
 from src.ui.theme import (
     ACCENT,
     BG,
@@ -31,6 +36,44 @@ from src.ui.theme import (
 from src.ui.workflow_header import build_workflow_header
 
 CONFIG_WORKFLOW_STEPS = ["Spotify", "AI", "Validation"]
+SETUP_LAYER_CACHE_SIZE = 8
+
+# Built once and shared by every render instead of per control.
+FIELD_STYLE = {
+    "bgcolor": BG_INPUT,
+    "color": FG,
+    "border_color": BORDER,
+    "focused_border_color": ACCENT,
+    "label_style": ft.TextStyle(color=FG_DIM),
+    "cursor_color": FG,
+}
+CARD_BORDER = ft.border.all(1, BORDER)
+SELECTED_PROVIDER_BORDER = ft.border.all(2, ACCENT)
+PROVIDER_BORDER = ft.border.all(2, BORDER)
+DIM_BUTTON_STYLE = ft.ButtonStyle(color=FG_DIM)
+LINK_BUTTON_STYLE = ft.ButtonStyle(color=FG_LINK)
+ACCENT_BUTTON_STYLE = ft.ButtonStyle(shape=ft.RoundedRectangleBorder(radius=8))
+STEP_NUMBER_STYLE = ft.TextStyle(weight=ft.FontWeight.BOLD, color=ACCENT)
+STEP_LINE_STYLE = ft.TextStyle(height=2.1)
+
+
+def _open_url(url: str) -> None:
+    """Launch the browser without stalling the event handler on its subprocess."""
+    threading.Thread(target=webbrowser.open, args=(url,), daemon=True).start()
+
+
+# Epochs are unique across views, so a new wizard never reuses an older view's stats.
+_CACHE_STAT_EPOCHS = itertools.count()
+
+
+@lru_cache(maxsize=4)
+def _cache_stats(epoch: int) -> tuple[str, Path, tuple[tuple[Path, bool], ...]]:
+    """Cache size, folder and files; ``epoch`` changes whenever the folder may have."""
+    return (
+        format_bytes(cache_total_size_bytes(include_progress=False)),
+        cache_root_dir(include_progress=False),
+        tuple(cache_locations(include_progress=False)),
+    )
 
 
 class SetupView(ft.Column):
@@ -49,7 +92,10 @@ class SetupView(ft.Column):
         self.config = config
         self.on_complete = on_complete
         self.on_cancel = on_cancel
-        self.cfg = config.load()
+        # Filled by _populate_from_cfg: the keychain lookup must not delay the first paint.
+        self.cfg: dict = {}
+        self._cfg_lock = threading.Lock()
+        self._cfg_shown = False
         self.current_step = max(0, min(start_step, 2))
         self.step_builders = [
             self._build_spotify,
@@ -61,104 +107,185 @@ class SetupView(ft.Column):
         self._is_closing = False
         self._cache_feedback = ""
         self._cache_feedback_color = FG_DIM
+        self._provider_cards: dict[str, tuple[ft.Container, ft.Text]] = {}
+        self._step_bodies: dict[int, ft.Control] = {}
+        # Renewed whenever the cache folder may have changed, to invalidate the setup layer.
+        self._cache_stat_epoch = next(_CACHE_STAT_EPOCHS)
+        self._setup_layer_cache: dict[tuple, ft.Control] = {}
+        # Persistent layout pieces; _render swaps only what changed.
+        self._step_container = ft.Container(padding=ft.padding.symmetric(horizontal=12, vertical=6))
+        self._spacer = ft.Container(expand=True)
+        self._header_key: tuple | None = None
+        self._header: ft.Control | None = None
+        self._nav_key: tuple | None = None
+        self._nav: ft.Control | None = None
 
         # Input refs
         self.client_id = ft.TextField(
             label="Client ID",
-            value=self.cfg.get("spotify_client_id", ""),
-            bgcolor=BG_INPUT,
-            color=FG,
-            border_color=BORDER,
-            focused_border_color=ACCENT,
-            label_style=ft.TextStyle(color=FG_DIM),
-            cursor_color=FG,
+            value="",
+            **FIELD_STYLE,
         )
         self.client_secret = ft.TextField(
             label="Client Secret",
-            value=self.cfg.get("spotify_client_secret", ""),
+            value="",
             password=True,
             can_reveal_password=True,
-            bgcolor=BG_INPUT,
-            color=FG,
-            border_color=BORDER,
-            focused_border_color=ACCENT,
-            label_style=ft.TextStyle(color=FG_DIM),
-            cursor_color=FG,
+            **FIELD_STYLE,
         )
-        self.provider_var = self.cfg.get("llm_provider", "openai")
+        self.provider_var = "openai"
         self.api_key = ft.TextField(
             label="API Key",
-            value=self.cfg.get("llm_api_key", ""),
+            value="",
             password=True,
             can_reveal_password=True,
-            bgcolor=BG_INPUT,
-            color=FG,
-            border_color=BORDER,
-            focused_border_color=ACCENT,
-            label_style=ft.TextStyle(color=FG_DIM),
-            cursor_color=FG,
+            **FIELD_STYLE,
+        )
+        # Built once; _apply_provider only retargets its label.
+        self._key_link = ft.TextButton(
+            f"\U0001F511  Get a {PROVIDERS[self.provider_var]['name']} key",
+            on_click=self._on_key_link_click,
+            style=LINK_BUTTON_STYLE,
         )
         self.error_text = ft.Text("", color=DANGER, size=12)
         self.busy_label = ft.Text("", color=FG_DIM, size=11, visible=False)
         self.step_activity = ft.ProgressRing(width=14, height=14, color=ACCENT, visible=False)
         self.is_validating = False
+        self._is_saving = False
+        self._verified_spotify: tuple[str, str] | None = None
+        self._verified_ai: tuple[str, str] | None = None
 
         self.expand = True
         self.width = float("inf")
         self.horizontal_alignment = ft.CrossAxisAlignment.CENTER
         self.alignment = ft.MainAxisAlignment.START
         self.spacing = 0
+        self._resize_debouncer = Debouncer()
         self._page.on_resized = self._on_resize
         self._render()
+        # Validation and save join this first: they must not run on a partial cfg.
+        self._cfg_loader = threading.Thread(target=self._populate_from_cfg, daemon=True)
+        self._cfg_loader.start()
+
+    def _populate_from_cfg(self):
+        loaded = self.config.load()
+        with self._cfg_lock:
+            # Anything the user already chose or typed wins over the stored config.
+            loaded.update(self.cfg)
+            self.cfg = loaded
+        # Only the dict is filled here; controls are touched on the page's event loop.
+        self._page.run_task(self._show_loaded_cfg)
+
+    async def _show_loaded_cfg(self):
+        self._apply_loaded_cfg()
+        # The window is painted: build the other cached steps so Continue only swaps them in.
+        for step in range(len(self.step_builders) - 1):
+            self._step_body(step)
+
+    def _apply_loaded_cfg(self):
+        if self._cfg_shown:
+            return
+        self._cfg_shown = True
+        self._apply_provider(self.cfg.get("llm_provider", "openai"))
+        for field, key in (
+            (self.client_id, "spotify_client_id"),
+            (self.client_secret, "spotify_client_secret"),
+            (self.api_key, "llm_api_key"),
+        ):
+            if not field.value:
+                field.value = self.cfg.get(key, "")
+        self._refresh()
 
     def _render(self):
         self._sync_layout_metrics()
-        self.controls.clear()
-        self.controls.append(
-            ft.Container(
-                content=build_workflow_header(
-                    page=self._page,
-                    current_step=self.current_step + 1,
-                    subtitle=f"Local configuration - Step {self.current_step + 1}/3",
-                    step_labels=CONFIG_WORKFLOW_STEPS,
-                    width=float("inf"),
-                ),
+        self._step_container.content = self._step_body(self.current_step)
+        self._step_container.width = self._content_width
+        # Unchanged parts come back as the same instances, so Flet only diffs what changed.
+        self.controls = [
+            self._header_for_step(),
+            self._build_setup_layer(),
+            self._step_container,
+            self._spacer,
+            self._nav_for_state(),
+        ]
+
+    def _header_for_step(self) -> ft.Control:
+        key = (self.current_step, getattr(self._page.window, "width", 0))
+        if self._header_key != key:
+            self._header = build_workflow_header(
+                page=self._page,
+                current_step=self.current_step + 1,
+                subtitle=f"Local configuration - Step {self.current_step + 1}/3",
+                step_labels=CONFIG_WORKFLOW_STEPS,
                 width=float("inf"),
-                padding=ft.padding.only(top=12, bottom=6),
-            )
-        )
-        self.controls.append(
-            self._build_setup_layer()
-        )
-        self.controls.append(
-            ft.Container(
-                content=self.step_builders[self.current_step](),
-                width=self._content_width,
-                padding=ft.padding.symmetric(horizontal=12, vertical=6),
             )
-        )
-        self.controls.append(ft.Container(expand=True))
-        self.controls.append(self._build_nav())
+            # Spacing goes on the header itself rather than on a wrapper container.
+            self._header.margin = ft.margin.only(top=12, bottom=6)
+            self._header_key = key
+        return self._header
+
+    def _nav_for_state(self) -> ft.Control:
+        key = (self.current_step, self._content_width, self._is_closing, self.is_validating, self._is_saving)
+        if self._nav_key != key:
+            self._nav = self._build_nav()
+            self._nav_key = key
+        return self._nav
+
+    def _refresh(self):
+        """Re-render and push one update, scoped to this view once it is mounted."""
+        self._render()
+        if self.uid is None:
+            self._page.update()
+        else:
+            self._page.update(self)
 
     def _sync_layout_metrics(self):
         width = int(getattr(self._page.window, "width", 0) or 980)
         usable_width = max(width - 48, 320)
         self._content_width = min(usable_width, 1080)
-        self._form_width = max(min(self._content_width - 24, 980), 300)
+        form_width = max(min(self._content_width - 24, 980), 300)
+        if form_width != self._form_width:
+            self._step_bodies.clear()
+        self._form_width = form_width
         self.client_id.width = self._form_width
         self.client_secret.width = self._form_width
         self.api_key.width = self._form_width
 
+    def _step_body(self, step: int) -> ft.Control:
+        """Reuse built step bodies on Back/Continue; the summary reflects cfg and is always rebuilt."""
+        if step == len(self.step_builders) - 1:
+            return self.step_builders[step]()
+        body = self._step_bodies.get(step)
+        if body is None:
+            body = self._step_bodies[step] = self.step_builders[step]()
+        return body
+
     def _build_setup_layer(self) -> ft.Control:
+        spotify_ready = bool(self.cfg.get("spotify_client_id") and self.cfg.get("spotify_client_secret"))
+        ai_ready = bool(self.cfg.get("llm_api_key"))
+        key = (
+            self._content_width,
+            spotify_ready,
+            ai_ready,
+            self.provider_var,
+            self._cache_feedback,
+            self._cache_feedback_color,
+            self._cache_stat_epoch,
+        )
+        cached = self._setup_layer_cache.get(key)
+        if cached is not None:
+            return cached
+        layer = self._setup_layer_cache[key] = self._build_setup_layer_uncached(spotify_ready, ai_ready)
+        if len(self._setup_layer_cache) > SETUP_LAYER_CACHE_SIZE:
+            del self._setup_layer_cache[next(iter(self._setup_layer_cache))]
+        return layer
+
+    def _build_setup_layer_uncached(self, spotify_ready: bool, ai_ready: bool) -> ft.Control:
         compact = self._content_width < 980
         logo_size = 168 if compact else 232
         logo_width = self._content_width if compact else max(300, int(self._content_width * 0.30))
         status_width = self._content_width if compact else max(420, self._content_width - logo_width - 12)
-        spotify_ready = bool(self.cfg.get("spotify_client_id") and self.cfg.get("spotify_client_secret"))
-        ai_ready = bool(self.cfg.get("llm_api_key"))
-        cache_size = format_bytes(cache_total_size_bytes(include_progress=False))
-        cache_dir = cache_root_dir(include_progress=False)
-        cache_files = cache_locations(include_progress=False)
+        cache_size, cache_dir, cache_files = _cache_stats(self._cache_stat_epoch)
 
         connection_controls: list[ft.Control] = [
             ft.Text(
@@ -199,7 +326,7 @@ class SetupView(ft.Column):
         connection_card = ft.Container(
             width=status_width,
             bgcolor=BG_CARD,
-            border=ft.border.all(1, BORDER),
+            border=CARD_BORDER,
             border_radius=10,
             padding=14,
             content=ft.Column(
@@ -215,7 +342,7 @@ class SetupView(ft.Column):
         cache_card = ft.Container(
             width=status_width,
             bgcolor=BG_CARD,
-            border=ft.border.all(1, BORDER),
+            border=CARD_BORDER,
             border_radius=10,
             padding=14,
             content=ft.Column(
@@ -274,7 +401,7 @@ class SetupView(ft.Column):
                     "Closing..." if self._is_closing else "Close configuration",
                     on_click=self._on_cancel,
                     disabled=self._is_closing or self.is_validating,
-                    style=ft.ButtonStyle(color=FG_DIM),
+                    style=DIM_BUTTON_STYLE,
                 )
             )
         if not is_first:
@@ -282,7 +409,7 @@ class SetupView(ft.Column):
                 ft.TextButton(
                     "\u2190  Back",
                     on_click=self._on_prev,
-                    style=ft.ButtonStyle(color=FG_DIM),
+                    style=DIM_BUTTON_STYLE,
                 )
             )
 
@@ -295,11 +422,10 @@ class SetupView(ft.Column):
                 ft.ElevatedButton(
                     "Open application  \u2192",
                     on_click=self._on_finish,
+                    disabled=self._is_saving,
                     bgcolor=ACCENT,
                     color=BG,
-                    style=ft.ButtonStyle(
-                        shape=ft.RoundedRectangleBorder(radius=8),
-                    ),
+                    style=ACCENT_BUTTON_STYLE,
                 )
             )
         else:
@@ -309,9 +435,7 @@ class SetupView(ft.Column):
                     on_click=self._on_next,
                     bgcolor=ACCENT,
                     color=BG,
-                    style=ft.ButtonStyle(
-                        shape=ft.RoundedRectangleBorder(radius=8),
-                    ),
+                    style=ACCENT_BUTTON_STYLE,
                 )
             )
 
@@ -331,24 +455,18 @@ class SetupView(ft.Column):
             "Copy the Client ID and Client Secret below",
         ]
 
-        step_items = []
-        for i, txt in enumerate(steps):
-            step_items.append(
-                ft.Row([
-                    ft.Text(f"{i + 1}.", size=12, weight=ft.FontWeight.BOLD, color=ACCENT, width=24),
-                    ft.Text(txt, size=12, color=FG_DIM),
-                ])
-            )
-            if i == 2:
-                step_items.append(
-                    ft.Container(
-                        content=ft.Text("http://127.0.0.1:8888/callback", size=11, color=ACCENT, font_family="monospace"),
-                        bgcolor=BG_INPUT,
-                        padding=ft.padding.symmetric(horizontal=10, vertical=4),
-                        border_radius=4,
-                        margin=ft.margin.only(left=24),
-                    )
-                )
+        # One rich Text per block of steps instead of a Row and two Texts per step.
+        step_items = [
+            self._numbered_steps(steps[:3], start=1),
+            ft.Container(
+                content=ft.Text("http://127.0.0.1:8888/callback", size=11, color=ACCENT, font_family="monospace"),
+                bgcolor=BG_INPUT,
+                padding=ft.padding.symmetric(horizontal=10, vertical=4),
+                border_radius=4,
+                margin=ft.margin.only(left=24),
+            ),
+            self._numbered_steps(steps[3:], start=4),
+        ]
 
         return ft.Column(
             [
@@ -363,8 +481,8 @@ class SetupView(ft.Column):
                         ft.Container(height=10),
                         ft.TextButton(
                             "\U0001F517  Open Spotify Developer Dashboard",
-                            on_click=lambda _: webbrowser.open("https://developer.spotify.com/dashboard"),
-                            style=ft.ButtonStyle(color=FG_LINK),
+                            on_click=lambda _: _open_url("https://developer.spotify.com/dashboard"),
+                            style=LINK_BUTTON_STYLE,
                         ),
                     ])
                 ),
@@ -378,45 +496,10 @@ class SetupView(ft.Column):
         )
 
     def _build_ai(self) -> ft.Column:
-        provider_cards = []
-        for key, info in PROVIDERS.items():
-            is_selected = self.provider_var == key
-            border_color = ACCENT if is_selected else BORDER
-            bg = BG_CARD if is_selected else BG_INPUT
-            indicator = "\u25C9" if is_selected else "\u25CB"
-
-            badge = []
-            if key == "openai":
-                badge.append(
-                    ft.Container(
-                        content=ft.Text("Recommended", size=10, color=BG),
-                        bgcolor=ACCENT,
-                        padding=ft.padding.symmetric(horizontal=8, vertical=2),
-                        border_radius=4,
-                    )
-                )
-
-            card = ft.Container(
-                content=ft.Column([
-                    ft.Row([
-                        ft.Text(indicator, size=16, color=ACCENT if is_selected else FG_DIM),
-                        ft.Text(info["label"], size=14, weight=ft.FontWeight.BOLD, color=FG),
-                        ft.Container(expand=True),
-                        *badge,
-                    ]),
-                    ft.Text(f"Default model: {info['default_model']}", size=11, color=FG_DIM),
-                ]),
-                bgcolor=bg,
-                width=self._form_width,
-                border=ft.border.all(2, border_color),
-                border_radius=8,
-                padding=15,
-                on_click=lambda _, k=key: self._select_provider(k),
-            )
-            provider_cards.append(card)
-
-        key_link_url = PROVIDERS[self.provider_var]["url"]
-        key_link_name = PROVIDERS[self.provider_var]["name"]
+        if not self._provider_cards:
+            self._provider_cards = {key: self._provider_card(key, info) for key, info in PROVIDERS.items()}
+        self._sync_provider_cards()
+        provider_cards = [card for card, _ in self._provider_cards.values()]
 
         return ft.Column(
             [
@@ -426,16 +509,55 @@ class SetupView(ft.Column):
                 *provider_cards,
                 ft.Container(height=15),
                 self.api_key,
-                ft.TextButton(
-                    f"\U0001F511  Get a {key_link_name} key",
-                    on_click=lambda _, url=key_link_url: webbrowser.open(url),
-                    style=ft.ButtonStyle(color=FG_LINK),
-                ),
+                self._key_link,
                 self.error_text,
             ],
             horizontal_alignment=ft.CrossAxisAlignment.CENTER,
         )
 
+    def _provider_card(self, key: str, info: dict) -> tuple[ft.Container, ft.Text]:
+        badge = []
+        if key == "openai":
+            badge.append(
+                ft.Container(
+                    content=ft.Text("Recommended", size=10, color=BG),
+                    bgcolor=ACCENT,
+                    padding=ft.padding.symmetric(horizontal=8, vertical=2),
+                    border_radius=4,
+                )
+            )
+
+        indicator = ft.Text("", size=16)
+        card = ft.Container(
+            content=ft.Column([
+                ft.Row([
+                    indicator,
+                    ft.Text(info["label"], size=14, weight=ft.FontWeight.BOLD, color=FG),
+                    ft.Container(expand=True),
+                    *badge,
+                ]),
+                ft.Text(f"Default model: {info['default_model']}", size=11, color=FG_DIM),
+            ]),
+            border_radius=8,
+            padding=15,
+            on_click=partial(self._on_provider_click, key),
+        )
+        return card, indicator
+
+    def _sync_provider_cards(self):
+        """Restyle the existing provider cards in place so Flet only sends attribute patches."""
+        for key, (card, _) in self._provider_cards.items():
+            card.width = self._form_width
+            self._style_provider_card(key)
+
+    def _style_provider_card(self, key: str):
+        card, indicator = self._provider_cards[key]
+        is_selected = self.provider_var == key
+        card.bgcolor = BG_CARD if is_selected else BG_INPUT
+        card.border = SELECTED_PROVIDER_BORDER if is_selected else PROVIDER_BORDER
+        indicator.value = "\u25C9" if is_selected else "\u25CB"
+        indicator.color = ACCENT if is_selected else FG_DIM
+
     def _build_confirm(self) -> ft.Column:
         provider_info = PROVIDERS.get(self.cfg.get("llm_provider", "openai"), PROVIDERS["openai"])
 
@@ -446,14 +568,18 @@ class SetupView(ft.Column):
             ("API Key", "\u2022" * 16),
         ]
 
-        summary_items = []
-        for label, value in rows:
-            summary_items.append(
-                ft.Row([
-                    ft.Text(label, size=12, weight=ft.FontWeight.BOLD, color=FG_DIM, width=120),
-                    ft.Text(value, size=12, color=FG),
-                ])
-            )
+        # One label column and one value column instead of a Row per line.
+        summary = ft.Row(
+            [
+                ft.Column(
+                    [ft.Text(label, size=12, weight=ft.FontWeight.BOLD, color=FG_DIM) for label, _ in rows],
+                    width=120,
+                    spacing=8,
+                ),
+                ft.Column([ft.Text(value, size=12, color=FG) for _, value in rows], spacing=8),
+            ],
+            vertical_alignment=ft.CrossAxisAlignment.START,
+        )
 
         return ft.Column(
             [
@@ -464,7 +590,8 @@ class SetupView(ft.Column):
                     size=13, color=FG_DIM, text_align=ft.TextAlign.CENTER,
                 ),
                 ft.Container(height=20),
-                self._card(ft.Column(summary_items, spacing=8)),
+                self._card(summary),
+                self.error_text,
             ],
             horizontal_alignment=ft.CrossAxisAlignment.CENTER,
         )
@@ -474,93 +601,134 @@ class SetupView(ft.Column):
     def _on_next(self, e):
         if self.is_validating:
             return
+        # Flag before scheduling: a second click queued behind this one must not advance again.
+        self.is_validating = True
+        # Credential checks are network round-trips: run them off the event handler.
+        self._page.run_task(self._on_next_async)
+
+    async def _on_next_async(self):
+        try:
+            advance = await self._validate_step()
+        finally:
+            self.is_validating = False
+        self.busy_label.visible = False
+        self.step_activity.visible = False
+        if advance:
+            self.current_step = min(self.current_step + 1, len(self.step_builders) - 1)
+        self._refresh()
+
+    async def _validate_step(self) -> bool:
+        if self._cfg_loader.is_alive():
+            await asyncio.to_thread(self._cfg_loader.join)
+        # Validation reads the fields: make sure the stored values are in them.
+        self._apply_loaded_cfg()
         self.error_text.value = ""
         self.busy_label.visible = False
         self.step_activity.visible = False
 
         if self.current_step == 0:
             if not self._validate_spotify_fields():
+                return False
+            credentials = (self.cfg["spotify_client_id"], self.cfg["spotify_client_secret"])
+            # Unchanged since the last successful check: no need to hit the network again.
+            if credentials != self._verified_spotify:
+                # Test Spotify credentials
+                self.busy_label.value = "Validating Spotify..."
+                self.busy_label.visible = True
+                self.step_activity.visible = True
+                self.error_text.value = "Validating Spotify credentials..."
+                self.error_text.color = FG_DIM
                 self._page.update()
-                return
-            # Test Spotify credentials
-            self.is_validating = True
-            self.busy_label.value = "Validating Spotify..."
-            self.busy_label.visible = True
-            self.step_activity.visible = True
-            self.error_text.value = "Validating Spotify credentials..."
-            self.error_text.color = FG_DIM
-            self._page.update()
 
-            if not self._test_spotify_credentials():
-                self.is_validating = False
-                self.step_activity.visible = False
+                if not await asyncio.to_thread(self._test_spotify_credentials):
+                    self.error_text.color = DANGER
+                    return False
+                self.error_text.value = ""
                 self.error_text.color = DANGER
-                self._page.update()
-                return
-            self.is_validating = False
-            self.step_activity.visible = False
-            self.error_text.value = ""
-            self.error_text.color = DANGER
+                self._verified_spotify = credentials
 
         if self.current_step == 1:
             if not self._validate_ai_fields():
+                return False
+            credentials = (self.provider_var, self.cfg["llm_api_key"])
+            if credentials != self._verified_ai:
+                # Test AI credentials
+                self.busy_label.value = "Validating AI..."
+                self.busy_label.visible = True
+                self.step_activity.visible = True
+                self.error_text.value = "Validating AI API key..."
+                self.error_text.color = FG_DIM
                 self._page.update()
-                return
-            # Test AI credentials
-            self.is_validating = True
-            self.busy_label.value = "Validating AI..."
-            self.busy_label.visible = True
-            self.step_activity.visible = True
-            self.error_text.value = "Validating AI API key..."
-            self.error_text.color = FG_DIM
-            self._page.update()
 
-            if not self._test_ai_credentials():
-                self.is_validating = False
-                self.step_activity.visible = False
+                if not await asyncio.to_thread(self._test_ai_credentials):
+                    self.error_text.color = DANGER
+                    return False
+                self.error_text.value = ""
                 self.error_text.color = DANGER
-                self._page.update()
-                return
-            self.is_validating = False
-            self.step_activity.visible = False
-            self.error_text.value = ""
-            self.error_text.color = DANGER
+                self._verified_ai = credentials
 
-        self.busy_label.visible = False
-        self.step_activity.visible = False
-        self.current_step += 1
-        self._render()
-        self._page.update()
+        return True
 
     def _on_prev(self, e):
-        if self.is_validating:
+        if self.is_validating or self._is_saving:
             return
         self.error_text.value = ""
         self.current_step -= 1
-        self._render()
-        self._page.update()
+        self._refresh()
+
+    def close(self) -> None:
+        """Drop a pending relayout so it never runs against a wizard that was replaced."""
+        self._resize_debouncer.cancel()
 
     def _on_resize(self, _e: ft.ControlEvent):
-        self._render()
-        self._page.update()
+        # A window drag fires a burst of events; lay out once it settles.
+        self._resize_debouncer(self._relayout)
+
+    def _relayout(self):
+        content_width = self._content_width
+        self._sync_layout_metrics()
+        if self._content_width == content_width:
+            return  # height-only resize: nothing in the wizard depends on it
+        self._refresh()
 
     def _on_finish(self, e):
+        if self._is_saving:
+            return
+        self._is_saving = True
+        self._resize_debouncer.cancel()
+        self.error_text.value = ""
         self.busy_label.value = "Opening application..."
         self.busy_label.visible = True
         self.step_activity.visible = True
-        self._page.update()
-        self.config.save(self.cfg)
+        self._refresh()
+        # Keychain writes can be slow: keep them off the event handler, and only
+        # hand over once saved since the next screen reloads the config.
+        threading.Thread(target=self._save_and_complete, name="setup-save").start()
+
+    def _save_and_complete(self):
+        # Saving a half-loaded cfg would drop stored keys and blank keychain secrets.
+        self._cfg_loader.join()
+        try:
+            self.config.save(self.cfg)
+        except Exception as exc:
+            self._is_saving = False
+            self.busy_label.visible = False
+            self.step_activity.visible = False
+            self.error_text.value = f"Could not save configuration: {str(exc)[:50]}"
+            self.error_text.color = DANGER
+            self._refresh()
+            return
         self.on_complete()
 
     def _on_cancel(self, _e):
-        if self.is_validating or self._is_closing or not self.on_cancel:
+        if self.is_validating or self._is_saving or self._is_closing or not self.on_cancel:
             return
         self._is_closing = True
+        self._resize_debouncer.cancel()
         self.busy_label.value = "Closing configuration..."
         self.busy_label.visible = True
         self.step_activity.visible = True
-        self._render()
-        self._page.update()
+        self._refresh()
         self._page.run_task(self._on_cancel_async)
 
     async def _on_cancel_async(self):
@@ -570,32 +738,44 @@ class SetupView(ft.Column):
                 self.on_cancel()
         except Exception:
             self._is_closing = False
-            self._render()
-            self._page.update()
+            self._refresh()
+
+    def _on_provider_click(self, key: str, _e: ft.ControlEvent):
+        self._select_provider(key)
 
     def _select_provider(self, key: str):
-        self.provider_var = key
-        self.cfg["llm_provider"] = key
-        self._render()
-        self._page.update()
+        with self._cfg_lock:
+            self._apply_provider(key)
+            self.cfg["llm_provider"] = key
+        self._refresh()
+
+    def _apply_provider(self, key: str):
+        previous, self.provider_var = self.provider_var, key
+        # Only the previously and newly selected cards change.
+        for changed in {previous, key} & self._provider_cards.keys():
+            self._style_provider_card(changed)
+        self._key_link.text = f"\U0001F511  Get a {PROVIDERS[key]['name']} key"
+
+    def _on_key_link_click(self, _e: ft.ControlEvent):
+        _open_url(PROVIDERS[self.provider_var]["url"])
 
     def _on_clear_cache(self, _e: ft.ControlEvent):
         removed = clear_cache(include_progress=False)
+        self._cache_stat_epoch = next(_CACHE_STAT_EPOCHS)
         self._cache_feedback = (
             "No cache file to delete."
             if removed == 0
             else f"Cache cleared ({removed} item(s) removed)."
         )
         self._cache_feedback_color = FG_DIM
-        self._render()
-        self._page.update()
+        self._refresh()
 
     def _on_open_cache_folder(self, _e: ft.ControlEvent):
         ok, message = open_cache_folder(include_progress=False)
+        self._cache_stat_epoch = next(_CACHE_STAT_EPOCHS)
         self._cache_feedback = message
         self._cache_feedback_color = FG_DIM if ok else DANGER
-        self._render()
-        self._page.update()
+        self._refresh()
 
     # ── Validation ──────────────────────────────────────────────────
 
@@ -683,11 +863,20 @@ class SetupView(ft.Column):
             content=content,
             width=self._form_width,
             bgcolor=BG_CARD,
-            border=ft.border.all(1, BORDER),
+            border=CARD_BORDER,
             border_radius=8,
             padding=18,
         )
 
+    def _numbered_steps(self, steps: list[str], start: int) -> ft.Text:
+        spans: list[ft.TextSpan] = []
+        for i, txt in enumerate(steps, start=start):
+            if spans:
+                spans.append(ft.TextSpan("\n"))
+            spans.append(ft.TextSpan(f"{i}.    ", STEP_NUMBER_STYLE))
+            spans.append(ft.TextSpan(txt))
+        return ft.Text(spans=spans, size=12, color=FG_DIM, style=STEP_LINE_STYLE)
+
     def _checklist_item(self, icon: str, text: str) -> ft.Row:
         return ft.Row([
             ft.Text(icon, size=16, color=ACCENT),
@@ -1,15 +1,20 @@
 """Use case: check for newer release on GitHub via semver comparison."""
 
 import json
+import os
 import re
+import time
 import urllib.request
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
+from pathlib import Path
 from typing import Optional
 
 from src.version import __version__
 
 GITHUB_REPO = "20uf/tidy-ur-spotify"
 RELEASES_URL = f"https://api.github.com/repos/{GITHUB_REPO}/releases/latest"
+UPDATE_CACHE_PATH = Path.home() / ".tidy-ur-spotify.update-cache.json"
+UPDATE_CACHE_TTL_SECONDS = 12 * 3600
 
 
 @dataclass
@@ -43,6 +48,42 @@ def parse_semver(version: str) -> tuple:
     return (major, minor, patch, 0, pre_num)
 
 
+def load_cached_update(
+    path: Path = UPDATE_CACHE_PATH,
+    ttl: float = UPDATE_CACHE_TTL_SECONDS,
+) -> tuple[bool, Optional[UpdateInfo]]:
+    """Return (hit, info) from the on-disk cache; hit is False when missing, stale or unreadable."""
+    try:
+        if time.time() - path.stat().st_mtime >= ttl:
+            return False, None
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return False, None
+
+    if not data:
+        return True, None
+    try:
+        info = UpdateInfo(**data)
+    except TypeError:
+        return False, None
+
+    # The app may have been upgraded since the answer was cached.
+    if parse_semver(info.latest) <= parse_semver(__version__):
+        return True, None
+    info.current = __version__
+    return True, info
+
+
+def save_cached_update(info: Optional[UpdateInfo], path: Path = UPDATE_CACHE_PATH) -> None:
+    """Atomically store the latest answer; an empty object marks "up-to-date"."""
+    temp_path = path.with_suffix(path.suffix + ".tmp")
+    try:
+        temp_path.write_text(json.dumps(asdict(info) if info else {}), encoding="utf-8")
+        os.replace(temp_path, path)
+    except OSError:
+        pass
+
+
 class CheckUpdateUseCase:
 
     def execute(self, timeout: float = 5.0) -> Optional[UpdateInfo]:
@@ -82,3 +123,16 @@ class CheckUpdateUseCase:
             download_url=download_url,
             release_url=release_url,
         )
+
+    def execute_cached(
+        self,
+        cache_path: Path = UPDATE_CACHE_PATH,
+        ttl: float = UPDATE_CACHE_TTL_SECONDS,
+    ) -> Optional[UpdateInfo]:
+        """Like execute(), but reuse an answer fetched less than ttl seconds ago."""
+        hit, info = load_cached_update(cache_path, ttl)
+        if hit:
+            return info
+        info = self.execute()
+        save_cached_update(info, cache_path)
+        return info
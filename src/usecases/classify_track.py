@@ -1,9 +1,10 @@
 """Use case: classify the current track into a theme."""
 
-import threading
+from concurrent.futures import Executor
 
 from src.domain.model import ClassificationSession, Decision, Track
 from src.domain.ports import ClassifierPort, PlaylistPort, ProgressPort
+from src.usecases.playlist_io import submit_playlist_write
 
 
 class ClassifyTrackUseCase:
@@ -13,10 +14,12 @@ class ClassifyTrackUseCase:
         classifier: ClassifierPort,
         playlist: PlaylistPort,
         progress: ProgressPort,
+        io_pool: Executor | None = None,
     ):
         self.classifier = classifier
         self.playlist = playlist
         self.progress = progress
+        self.io_pool = io_pool
 
     def execute(
         self,
@@ -24,12 +27,8 @@ class ClassifyTrackUseCase:
         track: Track,
         theme_key: str,
     ) -> Decision:
-        existing = session.decision_for(track.id)
-        if existing:
-            if theme_key not in existing.themes:
-                existing.themes.append(theme_key)
-            decision = existing
-        else:
+        decision = session.decision_for(track.id)
+        if decision is None:
             decision = Decision(
                 track_id=track.id,
                 track_name=track.name,
@@ -37,12 +36,13 @@ class ClassifyTrackUseCase:
                 themes=[theme_key],
             )
             session.add_decision(decision)
+        elif theme_key in decision.themes:
+            # Already in that playlist: nothing to write or save.
+            return decision
+        else:
+            decision.themes.append(theme_key)
 
-        threading.Thread(
-            target=self.playlist.add_track,
-            args=(theme_key, track.id),
-            daemon=True,
-        ).start()
+        submit_playlist_write(self.io_pool, self.playlist.add_track, theme_key, track.id)
 
         self.progress.save(session)
         return decision
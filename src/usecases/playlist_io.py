@@ -0,0 +1,29 @@
+"""Background execution of Spotify playlist writes."""
+
+import logging
+import threading
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Callable, Optional
+
+logger = logging.getLogger("tidy_ur_spotify.playlist_io")
+
+
+def build_playlist_io_pool() -> ThreadPoolExecutor:
+    """Single worker so writes stay in order: an undo's remove never overtakes its add."""
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="spotify-io")
+
+
+def submit_playlist_write(io_pool: Optional[Executor], fn: Callable[..., None], *args) -> None:
+    if io_pool is None:
+        threading.Thread(target=fn, args=args, daemon=True).start()
+        return
+    io_pool.submit(fn, *args).add_done_callback(_report_failure)
+
+
+def _report_failure(future: Future) -> None:
+    # Nobody waits on these futures: without this a failed write would vanish.
+    if future.cancelled():
+        return
+    error = future.exception()
+    if error is not None:
+        logger.error("Playlist write failed", exc_info=error)
@@ -1,17 +1,19 @@
 """Use case: undo the last classification decision."""
 
-import threading
+from concurrent.futures import Executor
 from typing import Optional
 
 from src.domain.model import ClassificationSession, Decision
 from src.domain.ports import PlaylistPort, ProgressPort
+from src.usecases.playlist_io import submit_playlist_write
 
 
 class UndoDecisionUseCase:
 
-    def __init__(self, playlist: PlaylistPort, progress: ProgressPort):
+    def __init__(self, playlist: PlaylistPort, progress: ProgressPort, io_pool: Executor | None = None):
         self.playlist = playlist
         self.progress = progress
+        self.io_pool = io_pool
 
     def execute(self, session: ClassificationSession) -> Optional[Decision]:
         last = session.undo_last()
@@ -20,11 +22,7 @@ class UndoDecisionUseCase:
 
         if last.themes:
             for theme_key in last.themes:
-                threading.Thread(
-                    target=self.playlist.remove_track,
-                    args=(theme_key, last.track_id),
-                    daemon=True,
-                ).start()
+                submit_playlist_write(self.io_pool, self.playlist.remove_track, theme_key, last.track_id)
 
         self.progress.save(session)
         return last
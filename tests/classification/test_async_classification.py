@@ -0,0 +1,61 @@
+"""Async classification path used by the pre-analysis runner."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+from src.adapters.classifier.openai_adapter import OpenAIClassifierAdapter
+
+
+class FakeAsyncCompletions:
+    def __init__(self):
+        self.calls = 0
+
+    async def create(self, model, messages, max_tokens):
+        self.calls += 1
+        payload = [
+            {"track_id": track_id, "suggested_theme": "ambiance", "confidence": 0.8, "reasoning": "Warm"}
+            for track_id in ("t1", "t2", "t3")
+        ]
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=json.dumps(payload)))])
+
+
+def test_default_async_classification_falls_back_to_blocking_call(liked_songs, classifier):
+    suggestions = asyncio.run(classifier.classify_batch_async(liked_songs))
+
+    assert [s.track_id for s in suggestions] == ["t1", "t2", "t3"]
+    assert classifier.get_suggestions("t1")
+
+
+def test_openai_async_client_is_reused_across_batches(monkeypatch, liked_songs):
+    monkeypatch.setenv("TIDY_SPOTIFY_DISABLE_PERSISTENT_CACHE", "1")
+    adapter = OpenAIClassifierAdapter(api_key="test", themes={})
+    completions = FakeAsyncCompletions()
+    adapter._async_client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+
+    async def run():
+        await adapter.classify_batch_async(liked_songs[:1])
+        await adapter.classify_batch_async(liked_songs[1:])
+        await adapter.classify_batch_async(liked_songs)
+
+    asyncio.run(run())
+
+    assert completions.calls == 2
+    assert adapter.get_suggestions("t3")[0].theme_key == "ambiance"
+
+
+def test_openai_close_closes_the_cached_async_client(monkeypatch, liked_songs):
+    monkeypatch.setenv("TIDY_SPOTIFY_DISABLE_PERSISTENT_CACHE", "1")
+    adapter = OpenAIClassifierAdapter(api_key="test", themes={})
+    closed = []
+
+    async def close():
+        closed.append(True)
+
+    adapter._async_client = SimpleNamespace(close=close)
+
+    adapter.close()
+    adapter.close()
+
+    assert closed == [True]
+    assert adapter._async_client is None
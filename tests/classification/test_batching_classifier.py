@@ -0,0 +1,133 @@
+"""Batching decorator: big requests are split and overlapping callers share in-flight tracks."""
+
+import asyncio
+import threading
+import time
+
+from src.adapters.classifier.batching import BatchingClassifierAdapter
+from src.domain.model import Suggestion, Track
+from src.domain.ports import ClassifierPort
+
+
+class SlowClassifier(ClassifierPort):
+    def __init__(self):
+        self.batches: list[list[str]] = []
+        self._suggestions: dict[str, list[Suggestion]] = {}
+        self._lock = threading.Lock()
+
+    def classify_batch(self, tracks):
+        with self._lock:
+            self.batches.append([t.id for t in tracks])
+        time.sleep(0.05)
+        for t in tracks:
+            self._suggestions[t.id] = [Suggestion(t.id, "ambiance", 0.9, "")]
+        return [s for t in tracks for s in self._suggestions[t.id]]
+
+    def get_suggestions(self, track_id):
+        return self._suggestions.get(track_id, [])
+
+    def preload(self, tracks, batch_size=10):
+        self.classify_batch(tracks)
+
+
+def _tracks(count: int) -> list[Track]:
+    return [Track(id=f"t{i}", name=f"Song {i}", artist="A", album="B") for i in range(count)]
+
+
+def test_large_request_is_split_into_batches():
+    inner = SlowClassifier()
+    classifier = BatchingClassifierAdapter(inner, batch_size=4)
+
+    suggestions = classifier.classify_batch(_tracks(10))
+
+    assert sorted(len(batch) for batch in inner.batches) == [2, 4, 4]
+    assert [s.track_id for s in suggestions] == [f"t{i}" for i in range(10)]
+
+
+def test_overlapping_callers_do_not_resend_in_flight_tracks():
+    inner = SlowClassifier()
+    classifier = BatchingClassifierAdapter(inner, batch_size=10)
+    tracks = _tracks(6)
+
+    first = threading.Thread(target=classifier.classify_batch, args=(tracks[:4],))
+    first.start()
+    time.sleep(0.01)
+    classifier.classify_batch(tracks[2:])
+    first.join()
+
+    sent = [track_id for batch in inner.batches for track_id in batch]
+    assert sorted(sent) == [t.id for t in tracks]
+    assert classifier.get_suggestions("t3")
+
+
+def test_preload_honours_its_batch_size():
+    inner = SlowClassifier()
+    classifier = BatchingClassifierAdapter(inner, batch_size=10)
+
+    classifier.preload(_tracks(5), batch_size=2)
+
+    assert sorted(len(batch) for batch in inner.batches) == [1, 2, 2]
+
+
+def test_failing_batch_releases_joined_callers():
+    class InterruptedClassifier(SlowClassifier):
+        def classify_batch(self, tracks):
+            time.sleep(0.05)
+            raise KeyboardInterrupt
+
+    classifier = BatchingClassifierAdapter(InterruptedClassifier())
+    tracks = _tracks(2)
+    errors: list[BaseException] = []
+
+    def join():
+        try:
+            classifier.classify_batch(tracks)
+        except BaseException as exc:
+            errors.append(exc)
+
+    owner = threading.Thread(target=join)
+    owner.start()
+    time.sleep(0.01)
+    join()
+    owner.join(timeout=1)
+
+    assert not owner.is_alive()
+    assert len(errors) == 2
+
+
+def test_close_releases_callers_waiting_on_queued_batches():
+    inner = SlowClassifier()
+    classifier = BatchingClassifierAdapter(inner, batch_size=1, max_concurrency=1)
+    errors: list[BaseException] = []
+
+    def run():
+        try:
+            classifier.classify_batch(_tracks(3))
+        except BaseException as exc:
+            errors.append(exc)
+
+    caller = threading.Thread(target=run)
+    caller.start()
+    time.sleep(0.01)
+    classifier.close()
+    caller.join(timeout=1)
+
+    assert not caller.is_alive()
+    assert errors
+    assert len(inner.batches) < 3
+
+
+def test_async_callers_join_tracks_already_in_flight():
+    inner = SlowClassifier()
+    classifier = BatchingClassifierAdapter(inner, batch_size=10)
+    tracks = _tracks(4)
+
+    blocking = threading.Thread(target=classifier.classify_batch, args=(tracks[:3],))
+    blocking.start()
+    time.sleep(0.01)
+    suggestions = asyncio.run(classifier.classify_batch_async(tracks))
+    blocking.join()
+
+    sent = [track_id for batch in inner.batches for track_id in batch]
+    assert sorted(sent) == [t.id for t in tracks]
+    assert [s.track_id for s in suggestions] == [t.id for t in tracks]
@@ -3,10 +3,13 @@
 Business rules for assigning a Liked Song to one or more themed playlists.
 """
 
+import logging
+
 import pytest
 
-from src.domain.model import ClassificationSession, Decision, Track
+from src.domain.model import ClassificationSession, Decision, Suggestion, Track
 from src.usecases.classify_track import ClassifyTrackUseCase
+from src.usecases.playlist_io import build_playlist_io_pool, submit_playlist_write
 from src.usecases.undo_decision import UndoDecisionUseCase
 
 
@@ -49,6 +52,17 @@ class TestUserClassifiesATrack:
 
         assert progress.exists()
 
+    def test_repeating_a_theme_does_not_write_again(self, track_a, classifier, playlist, progress):
+        session = ClassificationSession(track_ids=[track_a.id])
+        uc = ClassifyTrackUseCase(classifier, playlist, progress)
+        first = uc.execute(session, track_a, "ambiance")
+
+        again = uc.execute(session, track_a, "ambiance")
+
+        assert again is first
+        assert again.themes == ["ambiance"]
+        assert playlist.added == [("ambiance", track_a.id)]
+
 
 class TestUserSkipsATrack:
     """As a user, I skip a track I don't want to classify right now."""
@@ -137,3 +151,40 @@ class TestAiSuggestion:
     def test_no_suggestion_for_unknown_track(self, classifier):
         suggestions = classifier.get_suggestions("unknown_track_id")
         assert suggestions == []
+
+    def test_best_suggestion_is_the_most_confident(self, track_a, classifier):
+        classifier.preload([track_a], batch_size=10)
+        classifier.get_suggestions(track_a.id).append(
+            Suggestion(track_id=track_a.id, theme_key="lets_dance", confidence=0.95, reasoning="Upbeat")
+        )
+
+        assert classifier.best_suggestion(track_a.id).theme_key == "lets_dance"
+        assert classifier.best_suggestion("unknown_track_id") is None
+
+
+class TestPlaylistWritesOrder:
+    """Fast classify-then-undo never leaves a track behind in the playlist."""
+
+    def test_undo_remove_runs_after_its_add_on_shared_pool(self, track_a, classifier, playlist, progress):
+        pool = build_playlist_io_pool()
+        session = ClassificationSession(track_ids=[track_a.id])
+        ClassifyTrackUseCase(classifier, playlist, progress, io_pool=pool).execute(session, track_a, "ambiance")
+        UndoDecisionUseCase(playlist, progress, io_pool=pool).execute(session)
+        pool.shutdown(wait=True)
+
+        assert playlist.added == [("ambiance", track_a.id)]
+        assert playlist.removed == [("ambiance", track_a.id)]
+        assert playlist.tracks_in("ambiance") == []
+
+    def test_failing_write_is_logged(self, caplog):
+        pool = build_playlist_io_pool()
+
+        def failing_add(theme_key, track_id):
+            raise RuntimeError("Spotify is down")
+
+        with caplog.at_level(logging.ERROR, logger="tidy_ur_spotify.playlist_io"):
+            submit_playlist_write(pool, failing_add, "ambiance", "t1")
+            pool.shutdown(wait=True)
+
+        assert "Playlist write failed" in caplog.text
+        assert "Spotify is down" in caplog.text
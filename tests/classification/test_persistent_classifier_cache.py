@@ -1,6 +1,7 @@
 """Unit tests for persistent classifier cache behavior."""
 
 from pathlib import Path
+from types import MappingProxyType
 
 from src.adapters.classifier.persistent_cache import (
     PersistentSuggestionCache,
@@ -70,6 +71,15 @@ def test_track_cache_key_changes_when_namespace_changes():
     assert build_track_cache_key(ns_a, track) != build_track_cache_key(ns_b, track)
 
 
+def test_namespace_is_the_same_for_read_only_themes():
+    themes = {"ambiance": {"name": "Ambiance", "description": "Warm and chill", "key": "1"}}
+    frozen = MappingProxyType({k: MappingProxyType(v) for k, v in themes.items()})
+
+    assert build_cache_namespace("openai", "gpt-4o-mini", frozen) == build_cache_namespace(
+        "openai", "gpt-4o-mini", themes
+    )
+
+
 def test_corrupt_cache_file_is_ignored(tmp_path: Path):
     path = tmp_path / "broken-cache.json"
     path.write_text("{not-json", encoding="utf-8")
@@ -0,0 +1,16 @@
+"""Provider registry: every selectable provider can build its classifier."""
+
+from src.adapters.classifier import FACTORIES, PROVIDERS
+from src.domain.ports import ClassifierPort
+
+
+def test_every_provider_has_a_factory():
+    assert set(FACTORIES) == set(PROVIDERS)
+
+
+def test_factories_build_classifiers_with_the_shared_signature():
+    for provider, meta in PROVIDERS.items():
+        classifier = FACTORIES[provider](api_key="test", model=meta["default_model"], themes={})
+
+        assert isinstance(classifier, ClassifierPort)
+        assert classifier.model == meta["default_model"]
@@ -8,6 +8,7 @@ import os
 
 import pytest
 
+from src.adapters.progress.debounced_progress_adapter import DebouncedProgressAdapter
 from src.adapters.progress.json_progress_adapter import JsonProgressAdapter
 from src.domain.model import ClassificationSession, Decision
 from src.usecases.classify_track import ClassifyTrackUseCase
@@ -173,3 +174,83 @@ class TestSessionPersistence:
         assert loaded.current_index == 0
         assert loaded.decisions == []
         assert loaded.track_ids == []
+
+
+class TestDecisionLookup:
+    """As a user going back and forth, past decisions are found instantly and stay accurate."""
+
+    def test_lookup_follows_add_and_undo(self):
+        session = ClassificationSession()
+        first = Decision(track_id="t1", track_name="A", artist="A", themes=["ambiance"])
+        session.add_decision(first)
+        session.add_decision(Decision(track_id="t2", track_name="B", artist="B", skipped=True))
+
+        session.undo_last()
+
+        assert session.decision_for("t1") is first
+        assert session.decision_for("t2") is None
+
+    def test_lookup_covers_decisions_the_session_was_restored_with(self):
+        first = Decision(track_id="t1", track_name="A", artist="A", skipped=True)
+        session = ClassificationSession(current_index=1, track_ids=["t1"], decisions=[first])
+
+        assert session.decision_for("t1") is first
+
+
+class TestDebouncedSaves:
+    """As a user classifying quickly, a burst of decisions is written once, and nothing is lost."""
+
+    def test_burst_of_saves_is_written_once_on_flush(self, progress):
+        saves = []
+        progress.save = lambda session: saves.append(session.current_index)
+        debounced = DebouncedProgressAdapter(progress, delay=60)
+        session = ClassificationSession(track_ids=["t1", "t2"])
+
+        for track_id in ("t1", "t2"):
+            session.add_decision(Decision(track_id=track_id, track_name="A", artist="A", skipped=True))
+            debounced.save(session)
+        assert saves == []
+
+        debounced.flush()
+
+        assert saves == [2]
+
+    def test_flush_writes_a_copy_of_the_decisions(self, progress):
+        debounced = DebouncedProgressAdapter(progress, delay=60)
+        session = ClassificationSession(track_ids=["t1"])
+        session.add_decision(Decision(track_id="t1", track_name="A", artist="A", themes=["ambiance"]))
+        debounced.save(session)
+
+        debounced.flush()
+        session.decisions[0].themes.append("lets_dance")
+
+        assert progress.load().decisions[0].themes == ["ambiance"]
+
+    def test_failed_flush_is_logged(self, progress, caplog):
+        def failing_save(session):
+            raise TypeError("not serializable")
+
+        progress.save = failing_save
+        debounced = DebouncedProgressAdapter(progress, delay=60)
+        debounced.save(ClassificationSession(current_index=1))
+
+        debounced.flush()
+
+        assert "Unable to save classification progress" in caplog.text
+
+    def test_close_writes_the_pending_save(self, progress):
+        debounced = DebouncedProgressAdapter(progress, delay=60)
+        debounced.save(ClassificationSession(current_index=3))
+
+        debounced.close()
+
+        assert progress.load().current_index == 3
+
+    def test_clear_discards_a_pending_save(self, progress):
+        debounced = DebouncedProgressAdapter(progress, delay=60)
+        debounced.save(ClassificationSession(current_index=1))
+
+        debounced.clear()
+        debounced.flush()
+
+        assert progress.load() is None
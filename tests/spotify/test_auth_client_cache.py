@@ -0,0 +1,74 @@
+"""Spotify client reuse across reconfigure/retry flows."""
+
+import time
+from types import SimpleNamespace
+
+import pytest
+from spotipy.exceptions import SpotifyException
+
+from src.adapters.spotify import auth
+
+
+class FakeSpotify:
+    def __init__(self, expires_at: float, fail_with: Exception | None = None):
+        self.user_calls = 0
+        self._fail_with = fail_with
+        token = {"expires_at": expires_at}
+        self.auth_manager = SimpleNamespace(cache_handler=SimpleNamespace(get_cached_token=lambda: token))
+
+    def current_user(self):
+        self.user_calls += 1
+        if self._fail_with:
+            raise self._fail_with
+        return {"id": "user-1", "display_name": "Listener"}
+
+
+@pytest.fixture(autouse=True)
+def empty_client_cache():
+    auth._client_cache.clear()
+    yield
+    auth._client_cache.clear()
+
+
+def test_valid_token_reuses_client_and_user(monkeypatch):
+    created = []
+
+    def fake_client(**_kwargs):
+        created.append(FakeSpotify(expires_at=time.time() + 3600))
+        return created[-1]
+
+    monkeypatch.setattr(auth, "get_spotify_client", fake_client)
+
+    first = auth.get_authenticated_client("cid", "secret")
+    second = auth.get_authenticated_client("cid", "secret")
+
+    assert len(created) == 1
+    assert first == second
+    assert created[0].user_calls == 1
+
+
+def test_expiring_token_authenticates_again(monkeypatch):
+    created = []
+
+    def fake_client(**_kwargs):
+        created.append(FakeSpotify(expires_at=time.time() + 30))
+        return created[-1]
+
+    monkeypatch.setattr(auth, "get_spotify_client", fake_client)
+
+    auth.get_authenticated_client("cid", "secret")
+    auth.get_authenticated_client("cid", "secret")
+
+    assert len(created) == 2
+
+
+def test_unauthorized_user_call_retries_once(monkeypatch):
+    clients = iter([
+        FakeSpotify(expires_at=0, fail_with=SpotifyException(401, -1, "expired")),
+        FakeSpotify(expires_at=time.time() + 3600),
+    ])
+    monkeypatch.setattr(auth, "get_spotify_client", lambda **_kwargs: next(clients))
+
+    _sp, user = auth.get_authenticated_client("cid", "secret")
+
+    assert user["id"] == "user-1"
@@ -0,0 +1,25 @@
+"""Liked songs are reused from disk on warm starts."""
+
+from src.adapters.spotify.liked_songs_cache import JsonLikedSongsCache
+
+
+def test_cached_tracks_roundtrip_for_same_user(tmp_path, liked_songs):
+    cache = JsonLikedSongsCache(str(tmp_path / "liked.json"))
+
+    cache.save("user-1", liked_songs)
+
+    assert cache.load("user-1") == liked_songs
+
+
+def test_other_user_does_not_see_cached_tracks(tmp_path, liked_songs):
+    cache = JsonLikedSongsCache(str(tmp_path / "liked.json"))
+    cache.save("user-1", liked_songs)
+
+    assert cache.load("user-2") is None
+
+
+def test_corrupt_cache_is_ignored(tmp_path):
+    path = tmp_path / "liked.json"
+    path.write_text("{not json", encoding="utf-8")
+
+    assert JsonLikedSongsCache(str(path)).load("user-1") is None
@@ -0,0 +1,97 @@
+"""Liked songs paging: concurrent pages keep library order and survive rate limits."""
+
+import threading
+
+from spotipy.exceptions import SpotifyException
+
+from src.adapters.spotify import track_adapter
+from src.adapters.spotify.track_adapter import PAGE_SIZE, SpotifyTrackAdapter
+
+
+def _item(index: int) -> dict:
+    return {"track": {"id": f"track-{index}", "name": f"Song {index}", "artists": [{"name": "Artist"}], "album": {}}}
+
+
+class PagedSpotify:
+    def __init__(self, total: int, rate_limited_offsets: set[int] | None = None):
+        self.total = total
+        self.rate_limited_offsets = set(rate_limited_offsets or ())
+        self.offsets: list[int] = []
+        self._lock = threading.Lock()
+
+    def current_user_saved_tracks(self, limit: int, offset: int):
+        with self._lock:
+            self.offsets.append(offset)
+            if offset in self.rate_limited_offsets:
+                self.rate_limited_offsets.discard(offset)
+                raise SpotifyException(429, -1, "rate limited", headers={"Retry-After": "0"})
+        items = [_item(i) for i in range(offset, min(offset + limit, self.total))]
+        return {"items": items, "total": self.total}
+
+
+def test_all_pages_are_fetched_in_library_order():
+    sp = PagedSpotify(total=PAGE_SIZE * 4 + 7)
+
+    tracks = SpotifyTrackAdapter(sp, concurrency=3).fetch_all()
+
+    assert [t.id for t in tracks] == [f"track-{i}" for i in range(PAGE_SIZE * 4 + 7)]
+    assert sorted(sp.offsets) == [0, PAGE_SIZE, PAGE_SIZE * 2, PAGE_SIZE * 3, PAGE_SIZE * 4]
+
+
+def test_rate_limited_page_is_retried(monkeypatch):
+    monkeypatch.setattr(track_adapter.time, "sleep", lambda _seconds: None)
+    sp = PagedSpotify(total=PAGE_SIZE * 2, rate_limited_offsets={PAGE_SIZE})
+
+    tracks = SpotifyTrackAdapter(sp).fetch_all()
+
+    assert len(tracks) == PAGE_SIZE * 2
+    assert sp.offsets.count(PAGE_SIZE) == 2
+
+
+def test_unchanged_library_is_revalidated_with_one_page():
+    sp = PagedSpotify(total=PAGE_SIZE * 3)
+    known = SpotifyTrackAdapter(sp).fetch_all()
+    sp.offsets.clear()
+
+    tracks = SpotifyTrackAdapter(sp).fetch_updates(known)
+
+    assert tracks == known
+    assert sp.offsets == [0]
+
+
+def test_new_likes_are_prepended_to_the_cached_library():
+    sp = PagedSpotify(total=PAGE_SIZE * 3)
+    known = SpotifyTrackAdapter(sp).fetch_all()
+    # Two new likes arrive at the head of the library.
+    sp.total += 2
+    original = sp.current_user_saved_tracks
+    sp.current_user_saved_tracks = lambda limit, offset: {
+        "items": [_item(-2), _item(-1)] + original(limit, offset)["items"][: limit - 2],
+        "total": sp.total,
+    }
+
+    tracks = SpotifyTrackAdapter(sp).fetch_updates(known)
+
+    assert [t.id for t in tracks[:3]] == ["track--2", "track--1", "track-0"]
+    assert tracks[2:] == known
+
+
+def test_removed_like_triggers_a_full_fetch():
+    sp = PagedSpotify(total=PAGE_SIZE * 3)
+    known = SpotifyTrackAdapter(sp).fetch_all()
+    sp.total -= 1
+    sp.offsets.clear()
+
+    tracks = SpotifyTrackAdapter(sp).fetch_updates(known)
+
+    assert len(tracks) == PAGE_SIZE * 3 - 1
+    assert sorted(sp.offsets) == [0, PAGE_SIZE, PAGE_SIZE * 2]
+
+
+def test_progress_is_reported_after_each_page():
+    sp = PagedSpotify(total=PAGE_SIZE * 2 + 5)
+    progress = []
+
+    SpotifyTrackAdapter(sp).fetch_all(on_progress=lambda loaded, total: progress.append((loaded, total)))
+
+    assert progress == [(PAGE_SIZE, PAGE_SIZE * 2 + 5), (PAGE_SIZE * 2, PAGE_SIZE * 2 + 5), (PAGE_SIZE * 2 + 5, PAGE_SIZE * 2 + 5)]
@@ -0,0 +1,54 @@
+"""Bounded context: Auto-update
+
+Update checks reuse a recent answer instead of hitting GitHub on every launch.
+"""
+
+import os
+import time
+
+from src.usecases.check_update import CheckUpdateUseCase, UpdateInfo
+
+
+class CountingUpdateCheck(CheckUpdateUseCase):
+    def __init__(self, info):
+        self.info = info
+        self.calls = 0
+
+    def execute(self, timeout: float = 5.0):
+        self.calls += 1
+        return self.info
+
+
+def test_fresh_cached_answer_skips_the_network(tmp_path):
+    cache_path = tmp_path / "update-cache.json"
+    info = UpdateInfo(current="0.0.1", latest="99.0.0", download_url="d", release_url="r")
+    use_case = CountingUpdateCheck(info)
+
+    first = use_case.execute_cached(cache_path=cache_path)
+    second = use_case.execute_cached(cache_path=cache_path)
+
+    assert use_case.calls == 1
+    assert first.latest == second.latest == "99.0.0"
+
+
+def test_up_to_date_answer_is_cached_too(tmp_path):
+    cache_path = tmp_path / "update-cache.json"
+    use_case = CountingUpdateCheck(None)
+
+    use_case.execute_cached(cache_path=cache_path)
+    result = use_case.execute_cached(cache_path=cache_path)
+
+    assert use_case.calls == 1
+    assert result is None
+
+
+def test_stale_cache_triggers_a_new_check(tmp_path):
+    cache_path = tmp_path / "update-cache.json"
+    use_case = CountingUpdateCheck(None)
+    use_case.execute_cached(cache_path=cache_path)
+    old = time.time() - 2 * 24 * 3600
+    os.utime(cache_path, (old, old))
+
+    use_case.execute_cached(cache_path=cache_path)
+
+    assert use_case.calls == 2
@@ -0,0 +1,96 @@
+"""User journey: only one app instance runs at a time, and shared startup work runs once."""
+
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.ui import app
+
+
+def _cmdlines(monkeypatch, by_pid: dict[int, str]):
+    monkeypatch.setattr(app, "_process_cmdline", lambda pid: by_pid.get(pid))
+
+
+def test_previous_instance_is_recognised_by_its_lock_token(monkeypatch):
+    _cmdlines(monkeypatch, {4242: "python main.py"})
+
+    assert app._is_process_running(4242, app._instance_token(4242))
+
+
+def test_reused_pid_running_another_script_is_not_ours(monkeypatch):
+    _cmdlines(monkeypatch, {4242: "python main.py"})
+    token = app._instance_token(4242)
+    _cmdlines(monkeypatch, {4242: "python ~/other-project/main.py"})
+
+    assert not app._is_process_running(4242, token)
+    assert not app._is_process_running(4242, "")
+
+
+def test_launch_blocked_by_a_running_instance_tells_the_user(monkeypatch):
+    shown = []
+
+    class Page:
+        def __init__(self):
+            self.controls = []
+            self.window = SimpleNamespace(close=lambda: None)
+
+        def add(self, *controls):
+            self.controls.extend(controls)
+
+        def update(self):
+            return None
+
+    def fake_app(target):
+        page = Page()
+        target(page)
+        shown.append(page)
+
+    monkeypatch.setattr(app, "_kill_previous_instance", lambda: False)
+    monkeypatch.setattr(app, "_create_lock", lambda: False)
+    monkeypatch.setattr(app, "_get_lock_pid", lambda: 4242)
+    monkeypatch.setattr(app.ft, "app", fake_app)
+
+    with pytest.raises(SystemExit):
+        app.run_app()
+
+    texts = [c.value for c in shown[0].controls[0].content.controls if isinstance(c, app.ft.Text)]
+    assert "Tidy ur Spotify is already running" in texts
+    assert any("4242" in text for text in texts)
+
+
+def test_interrupted_shared_call_releases_its_waiters():
+    started = threading.Event()
+    release = threading.Event()
+    results = []
+
+    def interrupted():
+        started.set()
+        release.wait()
+        raise KeyboardInterrupt
+
+    def owner():
+        try:
+            app._once("interrupted", interrupted)
+        except KeyboardInterrupt:
+            pass
+
+    def waiter():
+        try:
+            app._once("interrupted", lambda: "second call")
+        except BaseException as error:
+            results.append(type(error))
+
+    first = threading.Thread(target=owner)
+    first.start()
+    started.wait(timeout=2)
+    second = threading.Thread(target=waiter)
+    second.start()
+    time.sleep(0.05)
+    release.set()
+    first.join(timeout=2)
+    second.join(timeout=2)
+
+    assert not second.is_alive()
+    assert results == [KeyboardInterrupt]
@@ -1,5 +1,8 @@
 """User journey: app views can be instantiated at first launch."""
 
+import asyncio
+import threading
+import time
 from types import SimpleNamespace
 
 from src.domain.model import Theme
@@ -15,6 +18,9 @@ class DummyPage:
     def update(self):
         return None
 
+    def run_task(self, handler, *args):
+        return None
+
 
 class DummyConfig:
     def __init__(self):
@@ -45,6 +51,87 @@ def test_setup_view_instantiates_without_page_setter_error():
     assert view._page is page
 
 
+def test_setup_save_waits_for_the_stored_config():
+    page = DummyPage()
+    cfg = DummyConfig()
+    cfg._cfg.update(
+        spotify_client_id="id",
+        spotify_client_secret="secret",
+        llm_provider="anthropic",
+        llm_api_key="key",
+        legal_acknowledged=True,
+    )
+    stored = dict(cfg._cfg)
+    release = threading.Event()
+    stored_load = cfg.load
+    cfg.load = lambda: release.wait() and stored_load()
+    view = SetupView(page=page, config=cfg, on_complete=lambda: None)
+
+    saver = threading.Thread(target=view._save_and_complete)
+    saver.start()
+    release.set()
+    saver.join(timeout=2)
+
+    assert not saver.is_alive()
+    assert cfg._cfg == stored
+
+
+def test_failed_setup_save_is_reported_and_can_be_retried():
+    page = DummyPage()
+    cfg = DummyConfig()
+    completed = []
+
+    def failing_save(_cfg):
+        raise OSError("keychain locked")
+
+    cfg.save = failing_save
+    view = SetupView(page=page, config=cfg, on_complete=lambda: completed.append(True), start_step=2)
+    view._on_finish(None)
+    view._on_finish(None)
+    for thread in threading.enumerate():
+        if thread.name == "setup-save":
+            thread.join(timeout=2)
+
+    assert "keychain locked" in view.error_text.value
+    assert not view._is_saving
+    assert not completed
+
+
+def test_closed_setup_view_drops_its_pending_relayout():
+    page = DummyPage()
+    view = SetupView(page=page, config=DummyConfig(), on_complete=lambda: None)
+    relayouts = []
+    view._relayout = lambda: relayouts.append(True)
+    view._resize_debouncer.delay = 0.01
+
+    view._on_resize(None)
+    view.close()
+    time.sleep(0.05)
+
+    assert relayouts == []
+
+
+def test_queued_continue_clicks_advance_one_step():
+    page = DummyPage()
+    tasks = []
+    page.run_task = tasks.append
+    cfg = DummyConfig()
+    cfg._cfg.update(spotify_client_id="id", spotify_client_secret="secret")
+    view = SetupView(page=page, config=cfg, on_complete=lambda: None)
+    view._cfg_loader.join()
+    asyncio.run(tasks.pop()())
+    view._verified_spotify = ("id", "secret")
+
+    view._on_next(None)
+    view._on_next(None)
+    for task in tasks:
+        asyncio.run(task())
+
+    assert len(tasks) == 1
+    assert view.current_step == 1
+    assert not view.is_validating
+
+
 def test_classify_view_instantiates_without_page_setter_error(
     monkeypatch, track_a, classifier, playlist, progress
 ):
@@ -77,3 +164,49 @@ def test_classify_view_instantiates_without_page_setter_error(
 
     assert view._page is page
 
+
+def test_closed_classify_view_stops_its_preload_worker(
+    monkeypatch, track_a, classifier, playlist, progress
+):
+    monkeypatch.setattr(ClassifyView, "_preload_llm", lambda self: None)
+    view = ClassifyView(
+        page=DummyPage(),
+        tracks=[track_a],
+        themes={"ambiance": Theme(key="ambiance", name="Ambiance", description="Chill", shortcut="1")},
+        classifier=classifier,
+        playlist=playlist,
+        progress=progress,
+    )
+
+    view.close()
+    view._preload_thread.join(timeout=2)
+
+    assert not view._preload_thread.is_alive()
+
+
+def test_throttled_preload_status_is_pushed_when_the_interval_ends(
+    monkeypatch, track_a, classifier, playlist, progress
+):
+    monkeypatch.setattr(ClassifyView, "_preload_llm", lambda self: None)
+    view = ClassifyView(
+        page=DummyPage(),
+        tracks=[track_a],
+        themes={"ambiance": Theme(key="ambiance", name="Ambiance", description="Chill", shortcut="1")},
+        classifier=classifier,
+        playlist=playlist,
+        progress=progress,
+    )
+    pushed = []
+    view._schedule_update = lambda *controls: pushed.append(view.analysis_label.value)
+    view._analysis_track_ids = [track_a.id]
+    view._analysis_running = True
+    view._last_status_push = time.monotonic()
+
+    view._push_analysis_status()
+    assert pushed == []
+    view._analysis_done = 1
+    view._analysis_running = False
+    view._status_trailer.join(timeout=2)
+
+    assert pushed == ["AI preload: 1/1 (ready)"]
+    view.close()